@@ -1,25 +1,38 @@
 """Batch AlphaGenome ref-vs-alt regulatory predictions for LA gene–SNP pairs.
 
 Inputs:
-    ``overlapping_genes_with_snps.xlsx`` at repo root (gene/SNP list).
+    ``overlapping_genes_with_snps.xlsx`` at repo root (gene/SNP list); converted once
+    to a sibling ``.parquet`` cache that later runs read instead.
     ``ALPHA_GENOME_API_KEY`` in ``.env`` (required for live API calls).
 
 Outputs:
-    ``analysis/alphagenome/alphagenome_comparison_results.csv`` — raw API results
-    per gene/SNP pair (success, failed, or skipped).
+    ``analysis/alphagenome/alphagenome_comparison_results.csv`` — status per gene/SNP
+    pair (success, failed, or skipped); successes point at their ``outputs_npz`` file.
+    ``analysis/alphagenome/outputs/<gene>_<snp>.npz`` — ref/alt RNA-seq track arrays.
+    ``data/ref_cache.bin`` + ``data/ref_cache.idx.json`` — persistent reference-window
+    cache; windows already in it are not re-fetched from Ensembl.
 """
 
+import asyncio
+import functools
+import json
 import logging
+import mmap
 import os
-import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import requests
 from alphagenome.data import genome
 from alphagenome.models import dna_client
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -30,9 +43,46 @@ load_dotenv()
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent
 ALPHAGENOME_DATA_DIR = REPO_ROOT / "analysis" / "alphagenome"
 COMPARISON_CSV = ALPHAGENOME_DATA_DIR / "alphagenome_comparison_results.csv"
+OUTPUTS_NPZ_DIR = ALPHAGENOME_DATA_DIR / "outputs"
+
+REF_CACHE_BIN = Path("data/ref_cache.bin")
+REF_CACHE_INDEX = Path("data/ref_cache.idx.json")
+GENE_SNP_XLSX = Path("overlapping_genes_with_snps.xlsx")
+GENE_SNP_PARQUET = GENE_SNP_XLSX.with_suffix(".parquet")
+GENE_SNP_COLUMNS = (
+    'Gene Symbol', 'SNP Identifier', 'SNP Association', 'Chromosome', 'Start', 'End',
+)
 
 ALPHA_GENOME_API_KEY = os.getenv("ALPHA_GENOME_API_KEY")
 ENSEMBL_REST_URL = "https://rest.ensembl.org"
+# Concurrent Ensembl requests in flight (polite vs. the 15 req/s REST limit)
+ENSEMBL_MAX_IN_FLIGHT = 10
+# Max ids per Ensembl POST /variation request, and regions per POST /sequence/region
+ENSEMBL_POST_MAX_IDS = 200
+ENSEMBL_POST_MAX_REGIONS = 50
+_JSON_HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
+ENSEMBL_TIMEOUT_SEC = 10
+# Extra read timeout per item in a batch POST (each region returns ~10 kb of sequence)
+ENSEMBL_BATCH_TIMEOUT_PER_ITEM_SEC = 0.5
+# Concurrent AlphaGenome predict_variant RPCs
+ALPHAGENOME_MAX_WORKERS = 8
+
+
+def _build_session() -> requests.Session:
+    """Shared keep-alive session; retries 429/5xx with backoff (batch POSTs are read-only)."""
+    retry = Retry(
+        total=5,
+        backoff_factor=0.2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({"GET", "POST"}),
+    )
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+SESSION = _build_session()
 
 # Chromosome mapping from NCBI accession to UCSC format
 CHROMOSOME_MAPPING = {
@@ -45,67 +95,315 @@ CHROMOSOME_MAPPING = {
     'NC_000019.10': 'chr19', 'NC_000020.11': 'chr20', 'NC_000021.9': 'chr21',
     'NC_000022.11': 'chr22', 'NC_000023.11': 'chrX', 'NC_000024.10': 'chrY',
 }
+# NCBI accession -> bare Ensembl seq_region name ("1", ..., "X", "Y")
+_NC_TO_SHORT = {nc: ucsc[3:] for nc, ucsc in CHROMOSOME_MAPPING.items()}
 
-def get_ensembl_sequence(chrom: str, start: int, end: int, strand: int = 1) -> str | None:
-    """Fetch reference sequence from Ensembl REST API (GRCh38)."""
-    chrom_clean = CHROMOSOME_MAPPING.get(chrom, chrom)
-    if chrom_clean.startswith('chr'):
-        chrom_clean = chrom_clean[3:]
-    elif chrom_clean.startswith('NC_'):
-        for nc, chr_name in CHROMOSOME_MAPPING.items():
-            if nc == chrom:
-                chrom_clean = chr_name[3:]
-                break
-    
-    fetch_start = min(start, end)
-    fetch_end = max(start, end)
+def _ensembl_chrom(chrom: str) -> str:
+    """Map an NCBI accession / UCSC name to the bare Ensembl seq_region name."""
+    return _NC_TO_SHORT.get(chrom) or (chrom[3:] if chrom.startswith('chr') else chrom)
+
+
+def _region_string(chrom: str, start: int, end: int, strand: int = 1) -> str:
+    return f"{_ensembl_chrom(chrom)}:{min(start, end)}..{max(start, end)}:{strand}"
 
-    url = f"{ENSEMBL_REST_URL}/sequence/region/human/{chrom_clean}:{fetch_start}..{fetch_end}:{strand}?content-type=application/json"
+
+@functools.lru_cache(maxsize=4096)
+def _fetch_region_seq(region: str) -> str | None:
+    # Raises on HTTP/network errors so transient failures are not memoized.
+    url = f"{ENSEMBL_REST_URL}/sequence/region/human/{region}?content-type=application/json"
+    response = SESSION.get(url, headers={"Content-Type": "application/json"}, timeout=ENSEMBL_TIMEOUT_SEC)
+    response.raise_for_status()
+    return response.json().get("seq")
+
+def get_ensembl_sequence(chrom: str, start: int, end: int, strand: int = 1) -> str | None:
+    """Fetch reference sequence from Ensembl REST API (GRCh38); memoized per region."""
     try:
-        response = requests.get(url, headers={"Content-Type": "application/json"})
-        response.raise_for_status()
-        data = response.json()
-        return data.get("seq")
+        return _fetch_region_seq(_region_string(chrom, start, end, strand))
     except Exception as e:
         logger.error(f"Error fetching sequence for {chrom}:{start}-{end}: {e}")
         return None
 
-def get_snp_info_ensembl(rsid: str) -> dict[str, Any] | None:
-    """Fetch detailed SNP info from Ensembl Variation API (GRCh38)."""
+def _snp_info_from_variation(data: dict[str, Any]) -> dict[str, Any] | None:
+    """Pick the GRCh38 mapping out of an Ensembl variation record."""
+    mappings = data.get('mappings', [])
+    for mapping in mappings:
+        if mapping.get('assembly_name') == 'GRCh38':
+            allele_string = mapping.get('allele_string', '')
+            if '/' in allele_string:
+                ref = allele_string.split('/')[0]
+                alt = allele_string.split('/')[1]
+                return {
+                    'chrom': f"chr{mapping['seq_region_name']}",
+                    'pos': mapping['start'],
+                    'ref': ref,
+                    'alt': alt,
+                    'strand': mapping['strand']
+                }
+    return None
+
+@functools.lru_cache(maxsize=4096)
+def _fetch_snp_info(rsid: str) -> dict[str, Any] | None:
+    # Raises on HTTP/network errors so transient failures are not memoized.
     url = f"{ENSEMBL_REST_URL}/variation/human/{rsid}?content-type=application/json"
+    response = SESSION.get(url, headers={"Content-Type": "application/json"}, timeout=ENSEMBL_TIMEOUT_SEC)
+    response.raise_for_status()
+    return _snp_info_from_variation(response.json())
+
+def get_snp_info_ensembl(rsid: str) -> dict[str, Any] | None:
+    """Fetch detailed SNP info from Ensembl Variation API (GRCh38); memoized per rsID."""
     try:
-        response = requests.get(url, headers={"Content-Type": "application/json"})
+        return _fetch_snp_info(rsid)
+    except Exception:
+        return None
+
+def _chunks(items: list, size: int) -> list[list]:
+    it = iter(items)
+    return list(iter(lambda: list(islice(it, size)), []))
+
+def _batch_timeout(n_items: int) -> float:
+    return ENSEMBL_TIMEOUT_SEC + n_items * ENSEMBL_BATCH_TIMEOUT_PER_ITEM_SEC
+
+def get_snp_info_batch(rsids: list[str]) -> dict[str, dict[str, Any] | None]:
+    """POST up to ``ENSEMBL_POST_MAX_IDS`` rsIDs to ``/variation/human`` in one round trip.
+
+    If the batch request fails, each rsID is retried on its own via :func:`get_snp_info_ensembl`.
+    """
+    try:
+        response = SESSION.post(
+            f"{ENSEMBL_REST_URL}/variation/human",
+            json={"ids": rsids},
+            headers=_JSON_HEADERS,
+            timeout=_batch_timeout(len(rsids)),
+        )
         response.raise_for_status()
         data = response.json()
-        
-        mappings = data.get('mappings', [])
-        for mapping in mappings:
-            if mapping.get('assembly_name') == 'GRCh38':
-                allele_string = mapping.get('allele_string', '')
-                if '/' in allele_string:
-                    ref = allele_string.split('/')[0]
-                    alt = allele_string.split('/')[1]
-                    return {
-                        'chrom': f"chr{mapping['seq_region_name']}",
-                        'pos': mapping['start'],
-                        'ref': ref,
-                        'alt': alt,
-                        'strand': mapping['strand']
-                    }
-        return None
-    except Exception:
+    except Exception as e:
+        logger.warning(f"Variation batch of {len(rsids)} ids failed ({e}); retrying one by one")
+        return {rsid: get_snp_info_ensembl(rsid) for rsid in rsids}
+    return {rsid: _snp_info_from_variation(data[rsid]) if rsid in data else None for rsid in rsids}
+
+def get_ensembl_sequences_batch(
+    regions: list[tuple[str, int, int]],
+) -> dict[tuple[str, int, int], str | None]:
+    """POST up to ``ENSEMBL_POST_MAX_REGIONS`` regions to ``/sequence/region/human`` in one round trip.
+
+    Regions in a failed batch, or missing from its response, are retried one by one via
+    :func:`get_ensembl_sequence`, which logs any region that still cannot be fetched.
+    """
+    region_strings = [_region_string(chrom, start, end) for chrom, start, end in regions]
+    try:
+        response = SESSION.post(
+            f"{ENSEMBL_REST_URL}/sequence/region/human",
+            json={"regions": region_strings},
+            headers=_JSON_HEADERS,
+            timeout=_batch_timeout(len(regions)),
+        )
+        response.raise_for_status()
+        seq_by_query = {entry.get("query"): entry.get("seq") for entry in response.json()}
+    except Exception as e:
+        logger.warning(f"Sequence batch of {len(regions)} regions failed ({e}); retrying one by one")
+        seq_by_query = {}
+    return {
+        region: seq_by_query.get(query) or get_ensembl_sequence(*region)
+        for region, query in zip(regions, region_strings, strict=True)
+    }
+
+async def _run_limited(
+    sem: asyncio.Semaphore, func: Callable[..., Any], arg_tuples: Iterable[tuple]
+) -> list[Any]:
+    """Run blocking ``func(*args)`` for each tuple in worker threads, gated by ``sem``."""
+    async def one(args: tuple) -> Any:
+        async with sem:
+            return await asyncio.to_thread(func, *args)
+
+    return await asyncio.gather(*(one(args) for args in arg_tuples))
+
+
+async def _prefetch_ensembl_async(
+    rsids: list[str], regions: list[tuple[str, int, int]]
+) -> tuple[dict[str, dict[str, Any] | None], dict[tuple[str, int, int], str | None]]:
+    sem = asyncio.Semaphore(ENSEMBL_MAX_IN_FLIGHT)
+    snp_batches, seq_batches = await asyncio.gather(
+        _run_limited(
+            sem, get_snp_info_batch, [(chunk,) for chunk in _chunks(rsids, ENSEMBL_POST_MAX_IDS)]
+        ),
+        _run_limited(
+            sem,
+            get_ensembl_sequences_batch,
+            [(chunk,) for chunk in _chunks(regions, ENSEMBL_POST_MAX_REGIONS)],
+        ),
+    )
+    snp_info_by_rsid: dict[str, dict[str, Any] | None] = {}
+    for batch in snp_batches:
+        snp_info_by_rsid.update(batch)
+    seq_by_region: dict[tuple[str, int, int], str | None] = {}
+    for batch in seq_batches:
+        seq_by_region.update(batch)
+    return snp_info_by_rsid, seq_by_region
+
+
+def prefetch_ensembl(
+    rsids: list[str], regions: list[tuple[str, int, int]]
+) -> tuple[dict[str, dict[str, Any] | None], dict[tuple[str, int, int], str | None]]:
+    """Resolve SNP metadata and reference windows ahead of the AlphaGenome loop.
+
+    Uses the Ensembl POST batch endpoints (``ENSEMBL_POST_MAX_IDS`` ids or
+    ``ENSEMBL_POST_MAX_REGIONS`` regions per request), with chunks dispatched concurrently. Returns ``(snp_info_by_rsid, seq_by_region)``;
+    failed lookups map to ``None``.
+    """
+    return asyncio.run(_prefetch_ensembl_async(rsids, regions))
+
+
+class ReferenceCache:
+    """Append-only on-disk store of reference windows, read back through ``mmap``.
+
+    ``bin_path`` holds the concatenated ASCII sequences; ``index_path`` maps each
+    ``"chrom:start-end"`` window to its ``[offset, length]`` in that file.
+    """
+
+    def __init__(self, bin_path: Path = REF_CACHE_BIN, index_path: Path = REF_CACHE_INDEX):
+        self.bin_path = bin_path
+        self.index_path = index_path
+        self._index: dict[str, list[int]] = {}
+        if index_path.exists() and bin_path.exists():
+            try:
+                self._index = json.loads(index_path.read_text())
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable reference cache index {index_path}: {e}")
+        self._mm: mmap.mmap | None = None
+
+    @staticmethod
+    def _key(region: tuple[str, int, int]) -> str:
+        chrom, start, end = region
+        return f"{chrom}:{start}-{end}"
+
+    def __contains__(self, region: tuple[str, int, int]) -> bool:
+        return self._key(region) in self._index
+
+    def get(self, region: tuple[str, int, int]) -> bytes | None:
+        entry = self._index.get(self._key(region))
+        if entry is None:
+            return None
+        if self._mm is None:
+            with open(self.bin_path, 'rb') as f:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        offset, length = entry
+        return self._mm[offset:offset + length]
+
+    def put_many(self, seqs: dict[tuple[str, int, int], bytes]) -> None:
+        """Append new windows and rewrite the index (atomically via a temp file)."""
+        new = {self._key(region): seq for region, seq in seqs.items() if self._key(region) not in self._index}
+        if not new:
+            return
+        self.close()
+        self.bin_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.bin_path, 'ab') as f:
+            offset = f.tell()
+            for key, seq in new.items():
+                f.write(seq)
+                self._index[key] = [offset, len(seq)]
+                offset += len(seq)
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(self._index))
+        os.replace(tmp_path, self.index_path)
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+
+FASTA_LINE_WIDTH = 60
+
+
+def _fasta_lines(data: bytes) -> bytes:
+    """Break ``data`` into newline-terminated ``FASTA_LINE_WIDTH`` lines in one C-level pass."""
+    arr = np.frombuffer(data, dtype=np.uint8)
+    n_full = arr.size // FASTA_LINE_WIDTH
+    full = arr[: n_full * FASTA_LINE_WIDTH].reshape(n_full, FASTA_LINE_WIDTH)
+    newlines = np.full((n_full, 1), ord('\n'), dtype=np.uint8)
+    body = np.concatenate([full, newlines], axis=1).tobytes()
+    tail = data[n_full * FASTA_LINE_WIDTH:]
+    return body + tail + b"\n" if tail else body
+
+
+def save_fasta(filename: str, header: str, sequence: str | bytes | bytearray):
+    """Save a sequence to a FASTA file (60 bases per line, one buffered write)."""
+    data = sequence.encode('ascii') if isinstance(sequence, str) else bytes(sequence)
+    with open(filename, 'wb') as f:
+        f.write(b">" + header.encode('utf-8') + b"\n" + _fasta_lines(data))
+
+def load_gene_snp_table(
+    xlsx_path: Path = GENE_SNP_XLSX, parquet_path: Path = GENE_SNP_PARQUET
+) -> pd.DataFrame:
+    """Load the gene/SNP table, converting the workbook to a Parquet cache on first use.
+
+    The cache is rebuilt whenever the workbook is newer than it. Only the columns the
+    comparer reads are materialized.
+    """
+    if parquet_path.exists() and (
+        not xlsx_path.exists() or parquet_path.stat().st_mtime >= xlsx_path.stat().st_mtime
+    ):
+        logger.info(f"Reading input data from {parquet_path}")
+        return pd.read_parquet(parquet_path, columns=list(GENE_SNP_COLUMNS))
+
+    logger.info(f"Reading input data from {xlsx_path}")
+    df = pd.read_excel(xlsx_path, usecols=list(GENE_SNP_COLUMNS))
+    try:
+        df.to_parquet(parquet_path, index=False, engine="pyarrow")
+    except Exception as e:
+        logger.warning(f"Could not write Parquet cache {parquet_path}: {e}")
+    return df
+
+def _gene_window(start: Any, end: Any, window: int) -> tuple[int, int] | None:
+    """``(min - window, max + window)`` of a gene's span; None if a coordinate is not an integer."""
+    try:
+        start, end = int(start), int(end)
+    except (TypeError, ValueError):
         return None
+    return min(start, end) - window, max(start, end) + window
+
+def predict_variant_effect(model: Any, chrom: str, snp_pos: int, ref: str, alt: str) -> Any:
+    """Run one AlphaGenome ref-vs-alt RNA-seq prediction centred on the SNP."""
+    # Use the closest supported sequence length if possible, or truncate/extend
+    # Supported lengths: [2048, 16384, 131072, 524288, 1048576]
+    # We will use 131072 (128kb) as a default if the gene is smaller, 
+    # or 1048576 (1MB) if it's larger but within bounds.
+    # However, for the 'interval' argument, we should probably just center 
+    # a window of fixed size around the SNP.
+    
+    target_length = 131072 # 128kb
+    half_len = target_length // 2
+    
+    # Define a fixed-size interval centered on the SNP
+    ag_chrom = chrom if chrom.startswith('chr') else f"chr{chrom}"
+    
+    fixed_start = snp_pos - half_len
+    fixed_end = snp_pos + half_len
+    
+    interval = genome.Interval(ag_chrom, fixed_start, fixed_end)
+    variant = genome.Variant(ag_chrom, snp_pos, ref, alt)
+    
+    return model.predict_variant(
+        interval=interval,
+        variant=variant,
+        ontology_terms=['UBERON:0001157'], # Caudate nucleus (Brain)
+        requested_outputs=[dna_client.OutputType.RNA_SEQ]
+    )
 
-def save_fasta(filename: str, header: str, sequence: str):
-    """Save a sequence to a FASTA file."""
-    with open(filename, 'w') as f:
-        f.write(f">{header}\n")
-        for i in range(0, len(sequence), 60):
-            f.write(sequence[i:i+60] + "\n")
+def save_variant_outputs(outputs: Any, gene_symbol: str, snp_id: str) -> str:
+    """Store ref/alt RNA-seq track values as ``.npz``; returns the path relative to the data dir."""
+    rel_path = Path(OUTPUTS_NPZ_DIR.name) / f"{gene_symbol}_{snp_id}.npz"
+    OUTPUTS_NPZ_DIR.mkdir(parents=True, exist_ok=True)
+    np.savez(
+        ALPHAGENOME_DATA_DIR / rel_path,
+        ref=outputs.reference.rna_seq.values,
+        alt=outputs.alternate.rna_seq.values,
+    )
+    return rel_path.as_posix()
 
 def run_sequence_comparer():
-    logger.info("Reading input data from overlapping_genes_with_snps.xlsx")
-    df = pd.read_excel('overlapping_genes_with_snps.xlsx')
+    df = load_gene_snp_table()
     
     # Prioritize significant SNPs, then others until we reach 70
     sig_df = df[df['SNP Association'] == 'significant'].copy()
@@ -128,29 +426,53 @@ def run_sequence_comparer():
 
     gene_sequences = {}
     results = []
+    prediction_tasks = []
     processed_count = 0
     window = 5000 
 
-    for idx, row in all_potential_rows.iterrows():
-        gene_symbol = row['Gene Symbol']
-        snp_id = row['SNP Identifier']
-        
-        if not str(snp_id).startswith('rs'):
+    # Pre-resolve every candidate SNP and gene window concurrently; the loop below
+    # then only does dict lookups instead of ~2N sequential HTTP round-trips.
+    rs_rows = all_potential_rows[all_potential_rows['SNP Identifier'].astype(str).str.startswith('rs')]
+    gene_col, snp_col, chrom_col, start_col, end_col = (
+        rs_rows[c].to_numpy() for c in ('Gene Symbol', 'SNP Identifier', 'Chromosome', 'Start', 'End')
+    )
+    candidate_rsids = list(dict.fromkeys(snp_col))
+    candidate_regions = []
+    for gene_symbol, chrom, start, end in zip(gene_col, chrom_col, start_col, end_col, strict=True):
+        gene_window = _gene_window(start, end, window)
+        if gene_window is None:
+            logger.warning(f"Skipping {gene_symbol}: unparseable gene span {start}-{end}")
             continue
+        candidate_regions.append((chrom, *gene_window))
+    candidate_regions = list(dict.fromkeys(candidate_regions))
+    ref_cache = ReferenceCache()
+    missing_regions = [region for region in candidate_regions if region not in ref_cache]
+    logger.info(
+        f"Prefetching {len(candidate_rsids)} SNPs and {len(missing_regions)} reference windows from Ensembl "
+        f"({len(candidate_regions) - len(missing_regions)} windows cached in {REF_CACHE_BIN})."
+    )
+    snp_info_by_rsid, fetched = prefetch_ensembl(candidate_rsids, missing_regions)
+    fetched_bytes = {region: seq.encode('ascii') for region, seq in fetched.items() if seq}
+    ref_cache.put_many(fetched_bytes)
+    seq_by_region = {
+        region: fetched_bytes.get(region) or ref_cache.get(region) for region in candidate_regions
+    }
+    ref_cache.close()
 
-        snp_info = get_snp_info_ensembl(snp_id)
+    for gene_symbol, snp_id, chrom, start, end in zip(
+        gene_col, snp_col, chrom_col, start_col, end_col, strict=True
+    ):
+        snp_info = snp_info_by_rsid.get(snp_id)
         if not snp_info:
             continue
 
         if gene_symbol not in gene_sequences:
-            chrom = row['Chromosome']
-            start = int(row['Start'])
-            end = int(row['End'])
-            
-            w_start = min(start, end) - window
-            w_end = max(start, end) + window
+            gene_window = _gene_window(start, end, window)
+            if gene_window is None:
+                continue
+            w_start, w_end = gene_window
             
-            ref_seq = get_ensembl_sequence(chrom, w_start, w_end)
+            ref_seq = seq_by_region.get((chrom, w_start, w_end))
             if ref_seq:
                 gene_sequences[gene_symbol] = {
                     'seq': ref_seq,
@@ -169,56 +491,45 @@ def run_sequence_comparer():
         if rel_pos < 0 or rel_pos >= len(gene_info['seq']):
             continue
 
-        mut_seq_list = list(gene_info['seq'])
         # Handle cases where alt might be longer than 1bp (indels) - AlphaGenome usually works with SNPs
         if len(snp_info['ref']) == 1 and len(snp_info['alt']) == 1:
-            mut_seq_list[rel_pos] = snp_info['alt']
-            mut_seq = "".join(mut_seq_list)
+            mut_seq = bytearray(gene_info['seq'])
+            mut_seq[rel_pos] = ord(snp_info['alt'])
             
             alt_fasta_path = f"data/fasta/{gene_symbol}_{snp_id}_alt.fasta"
             save_fasta(alt_fasta_path, f"{gene_symbol}_{snp_id}_alt", mut_seq)
 
             if model:
-                try:
-                    # Use the closest supported sequence length if possible, or truncate/extend
-                    # Supported lengths: [2048, 16384, 131072, 524288, 1048576]
-                    # We will use 131072 (128kb) as a default if the gene is smaller, 
-                    # or 1048576 (1MB) if it's larger but within bounds.
-                    # However, for the 'interval' argument, we should probably just center 
-                    # a window of fixed size around the SNP.
-                    
-                    target_length = 131072 # 128kb
-                    half_len = target_length // 2
-                    
-                    # Define a fixed-size interval centered on the SNP
-                    ag_chrom = CHROMOSOME_MAPPING.get(gene_info['chrom'], gene_info['chrom'])
-                    if not ag_chrom.startswith('chr'): ag_chrom = f"chr{ag_chrom}"
-                    
-                    fixed_start = snp_pos - half_len
-                    fixed_end = snp_pos + half_len
-                    
-                    interval = genome.Interval(ag_chrom, fixed_start, fixed_end)
-                    variant = genome.Variant(ag_chrom, snp_pos, snp_info['ref'], snp_info['alt'])
-                    
-                    outputs = model.predict_variant(
-                        interval=interval,
-                        variant=variant,
-                        ontology_terms=['UBERON:0001157'], # Caudate nucleus (Brain)
-                        requested_outputs=[dna_client.OutputType.RNA_SEQ]
-                    )
-                    results.append({'gene': gene_symbol, 'snp': snp_id, 'status': 'success', 'outputs': outputs})
-                except Exception as e:
-                    results.append({'gene': gene_symbol, 'snp': snp_id, 'status': 'failed', 'error': str(e)})
+                ag_chrom = CHROMOSOME_MAPPING.get(gene_info['chrom'], gene_info['chrom'])
+                results.append({'gene': gene_symbol, 'snp': snp_id})
+                prediction_tasks.append(
+                    (len(results) - 1, (ag_chrom, snp_pos, snp_info['ref'], snp_info['alt']))
+                )
             else:
                 results.append({'gene': gene_symbol, 'snp': snp_id, 'status': 'skipped', 'reason': 'No API Key'})
             
             processed_count += 1
-            logger.info(f"Successfully processed {processed_count}/70: {gene_symbol} {snp_id}")
+            logger.info(f"Prepared {processed_count}/70: {gene_symbol} {snp_id}")
             
             if processed_count >= 70:
                 break
-        
-        time.sleep(0.05)
+
+    # predict_variant is a blocking RPC; fan the accepted SNPs out over a thread pool.
+    # Results are written back by index so the CSV keeps the input order.
+    if prediction_tasks:
+        with ThreadPoolExecutor(max_workers=ALPHAGENOME_MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(predict_variant_effect, model, *args): result_idx
+                for result_idx, args in prediction_tasks
+            }
+            for future in as_completed(futures):
+                result = results[futures[future]]
+                try:
+                    npz_path = save_variant_outputs(future.result(), result['gene'], result['snp'])
+                    result.update({'status': 'success', 'outputs_npz': npz_path})
+                except Exception as e:
+                    result.update({'status': 'failed', 'error': str(e)})
+                logger.info(f"AlphaGenome prediction {result['status']}: {result['gene']} {result['snp']}")
 
     results_df = pd.DataFrame(results)
     ALPHAGENOME_DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -2,7 +2,8 @@
 
 Inputs:
     ``analysis/alphagenome/alphagenome_comparison_results.csv`` (from
-    ``alphagenome_sequence_comparer.py``).
+    ``alphagenome_sequence_comparer.py``) and the ``outputs/*.npz`` track arrays it
+    references. Older CSVs that stringified the outputs are still parsed.
 
 Outputs:
     ``analysis/alphagenome/alphagenome_impact_analysis.csv`` — ref/alt RNA-seq
@@ -12,6 +13,7 @@ Outputs:
 import re
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent
@@ -19,10 +21,23 @@ ALPHAGENOME_DATA_DIR = REPO_ROOT / "analysis" / "alphagenome"
 COMPARISON_CSV = ALPHAGENOME_DATA_DIR / "alphagenome_comparison_results.csv"
 IMPACT_CSV = ALPHAGENOME_DATA_DIR / "alphagenome_impact_analysis.csv"
 
+# Legacy repr parsing: nonzero_mean in the TrackData metadata footer, else the first
+# value of the ``values=array([[...`` dump (ref, and the one after ``alternate=``).
+_RE_NONZERO_MEAN = re.compile(r'nonzero_mean.*?0\s+([\d\.e\-]+)', re.DOTALL)
+_RE_FIRST_VALUE = re.compile(r'values=array\(\[\[([\d\.e\-]+)')
+_RE_ALT_FIRST_VALUE = re.compile(r'alternate=.*?values=array\(\[\[([\d\.e\-]+)')
 
-def parse_track_data(data_str):
+
+def load_npz_scores(npz_path: Path) -> tuple[float, float]:
+    """Mean ref/alt RNA-seq signal from an ``.npz`` written by the comparer."""
+    with np.load(npz_path) as arrays:
+        return float(arrays['ref'].mean()), float(arrays['alt'].mean())
+
+def parse_legacy_track_repr(data_str):
     """
     Parses the string representation of AlphaGenome TrackData to extract mean values.
+
+    Only needed for comparison CSVs written before outputs were stored as ``.npz``.
     """
     try:
         parts = data_str.split('alternate=')
@@ -33,16 +48,43 @@ def parse_track_data(data_str):
         alt_part = parts[1]
         
         # Regex to find nonzero_mean in the table footer
-        ref_match = re.search(r'nonzero_mean.*?0\s+([\d\.e\-]+)', ref_part, re.DOTALL)
-        alt_match = re.search(r'nonzero_mean.*?0\s+([\d\.e\-]+)', alt_part, re.DOTALL)
+        ref_match = _RE_NONZERO_MEAN.search(ref_part)
+        alt_match = _RE_NONZERO_MEAN.search(alt_part)
         
         ref_score = float(ref_match.group(1)) if ref_match else 0.0
         alt_score = float(alt_match.group(1)) if alt_match else 0.0
         
+        # If the scores are 0, let's try to see if they are in scientific notation elsewhere
+        if ref_score == 0 and alt_score == 0:
+            # Maybe it's not nonzero_mean, let's look for anything that looks like a score
+            # The TrackData values array starts with some numbers
+            val_match = _RE_FIRST_VALUE.search(data_str)
+            if val_match:
+                # Use the first value as a proxy if we can't find the mean
+                ref_score = float(val_match.group(1))
+                # For alternate, it's after 'alternate='
+                alt_val_match = _RE_ALT_FIRST_VALUE.search(data_str)
+                alt_score = float(alt_val_match.group(1)) if alt_val_match else ref_score
+
         return ref_score, alt_score
     except Exception:
         return 0.0, 0.0
 
+def row_scores(npz_path, outputs) -> tuple[float | None, float | None]:
+    """Scores from the row's ``.npz`` if it exists, else from the legacy ``outputs`` repr.
+
+    Returns ``(None, None)`` (row dropped) when neither source is available.
+    """
+    if isinstance(npz_path, str) and npz_path:
+        full_path = ALPHAGENOME_DATA_DIR / npz_path
+        if full_path.is_file():
+            return load_npz_scores(full_path)
+        scores = parse_legacy_track_repr(str(outputs))
+        if scores[0] is None:
+            print(f"Warning: {full_path} not found and no legacy outputs to parse; skipping row.")
+        return scores
+    return parse_legacy_track_repr(str(outputs))
+
 def analyze_results():
     df = pd.read_csv(COMPARISON_CSV)
     
@@ -57,36 +99,22 @@ def analyze_results():
     # print("DEBUG: First row output snippet:")
     # print(str(success_df.iloc[0]['outputs'])[:1000])
 
-    analysis = []
-    for idx, row in success_df.iterrows():
-        out_str = str(row['outputs'])
-        ref_score, alt_score = parse_track_data(out_str)
-        
-        # If the scores are 0, let's try to see if they are in scientific notation elsewhere
-        if ref_score == 0 and alt_score == 0:
-            # Maybe it's not nonzero_mean, let's look for anything that looks like a score
-            # The TrackData values array starts with some numbers
-            val_match = re.search(r'values=array\(\[\[([\d\.e\-]+)', out_str)
-            if val_match:
-                # Use the first value as a proxy if we can't find the mean
-                ref_score = float(val_match.group(1))
-                # For alternate, it's after 'alternate='
-                alt_val_match = re.search(r'alternate=.*?values=array\(\[\[([\d\.e\-]+)', out_str)
-                alt_score = float(alt_val_match.group(1)) if alt_val_match else ref_score
+    npz_col = success_df['outputs_npz'] if 'outputs_npz' in success_df else [None] * len(success_df)
+    outputs_col = success_df['outputs'] if 'outputs' in success_df else [None] * len(success_df)
+    scores = [row_scores(npz_path, outputs) for npz_path, outputs in zip(npz_col, outputs_col, strict=True)]
+    parsed = np.array([ref_score is not None for ref_score, _ in scores], dtype=bool)
 
-        if ref_score is not None:
-            diff = alt_score - ref_score
-            perc_change = (diff / ref_score * 100) if ref_score != 0 else 0
-            analysis.append({
-                'gene': row['gene'],
-                'snp': row['snp'],
-                'ref_score': ref_score,
-                'alt_score': alt_score,
-                'diff': diff,
-                'perc_change': perc_change
-            })
-    
-    analysis_df = pd.DataFrame(analysis)
+    analysis_df = pd.DataFrame({
+        'gene': success_df['gene'].to_numpy()[parsed],
+        'snp': success_df['snp'].to_numpy()[parsed],
+        'ref_score': np.array([ref for (ref, _), ok in zip(scores, parsed) if ok], dtype=float),
+        'alt_score': np.array([alt for (_, alt), ok in zip(scores, parsed) if ok], dtype=float),
+    })
+    ref = analysis_df['ref_score'].to_numpy()
+    analysis_df['diff'] = analysis_df['alt_score'] - analysis_df['ref_score']
+    analysis_df['perc_change'] = np.divide(
+        analysis_df['diff'].to_numpy(), ref, out=np.zeros_like(ref), where=ref != 0
+    ) * 100
     
     if analysis_df.empty:
         print("Could not extract scores from any successful results. The CSV string representation might be missing metadata.")
@@ -12,8 +12,9 @@ Outputs:
 from pathlib import Path
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-import seaborn as sns
+from matplotlib.colors import LogNorm
 
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent
 ALPHAGENOME_DATA_DIR = REPO_ROOT / "analysis" / "alphagenome"
@@ -21,29 +22,45 @@ FIGURES_DIR = REPO_ROOT / "figures" / "alphagenome"
 IMPACT_CSV = ALPHAGENOME_DATA_DIR / "alphagenome_impact_analysis.csv"
 BAR_PLOT = FIGURES_DIR / "alphagenome_impact_bar_plot.png"
 SCATTER_PLOT = FIGURES_DIR / "alphagenome_ref_vs_alt_scatter.png"
+TOP_N = 20
+# Above this many variants the scatter is binned into a density image instead of
+# drawing one marker per point (render time and PNG size stay fixed)
+DENSITY_SCATTER_MIN_POINTS = 50_000
+DENSITY_BINS = 512
 
 
 def create_visualizations():
     try:
-        df = pd.read_csv(IMPACT_CSV)
+        # pyarrow engine: multi-threaded parse; columns stay NumPy-backed for matplotlib
+        df = pd.read_csv(IMPACT_CSV, engine="pyarrow")
     except FileNotFoundError:
         print(f"Analysis file not found at {IMPACT_CSV}. Run the analysis script first.")
         return
+    if df.empty:
+        print(f"No variants in {IMPACT_CSV}; nothing to plot.")
+        return
 
     FIGURES_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Filter for top 20 variants by absolute percentage change
-    top_df = df.sort_values(by='abs_perc_change', ascending=False).head(20)
+    # Filter for top 20 variants by absolute percentage change: O(N) partition, then
+    # sort only the selected rows (NaN sorts as largest in NumPy, so -NaN lands last)
+    neg_abs = -df['abs_perc_change'].to_numpy()
+    k = min(TOP_N, len(neg_abs))
+    top_idx = np.argpartition(neg_abs, k - 1)[:k] if k < len(neg_abs) else np.arange(k)
+    top_idx = top_idx[np.argsort(neg_abs[top_idx], kind='stable')]
+    top_df = df.iloc[top_idx].copy()
 
     # 1. Bar plot of percentage changes
     plt.figure(figsize=(12, 8))
     # Create a column for display: "Gene (SNP)"
-    top_df['display_name'] = top_df['gene'] + " (" + top_df['snp'] + ")"
+    top_df['display_name'] = top_df['gene'].str.cat(top_df['snp'], sep=" (") + ")"
     
-    # Use a custom color palette based on positive/negative change
-    colors = ['#ff7f0e' if x > 0 else '#1f77b4' for x in top_df['perc_change']]
+    # Color each bar by the sign of its change (orange = increase, blue = decrease)
+    colors = np.where(top_df['perc_change'].to_numpy() > 0, '#ff7f0e', '#1f77b4')
     
-    sns.barplot(data=top_df, x='perc_change', y='display_name', palette=colors)
+    # Categorical y axis: repeated gene/SNP rows share one slot, as in seaborn's barplot
+    plt.barh(top_df['display_name'], top_df['perc_change'], color=colors)
+    plt.gca().invert_yaxis()  # largest impact at the top
     plt.axvline(x=0, color='black', linestyle='-', linewidth=1)
     plt.title('Top 20 Predicted Regulatory Impacts (RNA-seq % Change)', fontsize=15)
     plt.xlabel('Predicted Expression Change (%)', fontsize=12)
@@ -53,11 +70,26 @@ def create_visualizations():
     print(f"Saved {BAR_PLOT}")
 
     # 2. Scatter plot of Ref vs Alt scores
+    scores = df[['ref_score', 'alt_score']].to_numpy(dtype=float)
+    if not np.isfinite(scores).any():
+        print("No finite ref/alt scores to plot; skipping the scatter plot.")
+        return
     plt.figure(figsize=(10, 8))
-    plt.scatter(df['ref_score'], df['alt_score'], alpha=0.6, color='purple')
+    ref = df['ref_score'].to_numpy()
+    alt = df['alt_score'].to_numpy()
+    if len(df) >= DENSITY_SCATTER_MIN_POINTS:
+        finite = np.isfinite(ref) & np.isfinite(alt)
+        counts, x_edges, y_edges = np.histogram2d(ref[finite], alt[finite], bins=DENSITY_BINS)
+        plt.imshow(np.ma.masked_equal(counts.T, 0), origin='lower', aspect='auto',
+                   extent=(x_edges[0], x_edges[-1], y_edges[0], y_edges[-1]),
+                   cmap='viridis', norm=LogNorm(), interpolation='nearest')
+        plt.colorbar(label='Variants per bin')
+    else:
+        plt.scatter(ref, alt, alpha=0.6, color='purple')
     
     # Add a diagonal line for y=x (no change)
-    max_val = max(df['ref_score'].max(), df['alt_score'].max())
+    # One reduction over both score columns; nanmax keeps pandas' skip-NaN semantics
+    max_val = np.nanmax(scores)
     plt.plot([0, max_val], [0, max_val], 'r--', alpha=0.8, label='No Change (y=x)')
     
     plt.title('Predicted RNA-seq Scores: Reference vs Alternate Alleles', fontsize=15)
@@ -67,8 +99,9 @@ def create_visualizations():
     plt.grid(True, linestyle=':', alpha=0.7)
     
     # Annotate top variants
-    for i, row in top_df.head(5).iterrows():
-        plt.annotate(row['gene'], (row['ref_score'], row['alt_score']), 
+    top5 = top_df.head(5)
+    for gene, ref_score, alt_score in zip(top5['gene'], top5['ref_score'], top5['alt_score']):
+        plt.annotate(gene, (ref_score, alt_score),
                      textcoords="offset points", xytext=(0,10), ha='center', fontsize=9)
                      
     plt.tight_layout()
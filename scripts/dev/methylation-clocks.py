@@ -15,33 +15,129 @@ Coefficients: Use the official file from
   or Table S2 from the paper supplementary material.
 """
 
+import functools
+import itertools
+import re
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 
+try:  # numba is optional: JIT-compiled scoring kernel when available
+    from numba import njit as _njit
+except ImportError:  # pragma: no cover - depends on environment
+    _njit = None
+
 # Default path for coefficient file (same directory as this module)
 # horvath_353_coefficients.csv for an alternate title
 # currently, gb-2013-14-10-r115-S3.csv is the file that contains the coefficients for the Horvath 2013 epigenetic clock (Additional file 3 from the paper
 # Supplementary Table S3)
 _DEFAULT_COEF_PATH = Path(__file__).resolve().parent / "test_data" / "gb-2013-14-10-r115-S3.csv"
 
+# Substrings identifying the header row and the probe / coefficient columns, matched
+# against lowercased names with separators removed (ProbeID, probe_id, "Probe ID", ...)
+_HEADER_KEYS = ("cpgmarker", "probe")
+_PROBE_COLUMN_KEYS = ("cpgmarker", "probe", "cg")
+_COEF_COLUMN_KEYS = ("coefficient", "coef", "weight")
+_HEADER_SEPARATORS_RE = re.compile(r"[\s_\-.]+")
 
-def _load_horvath_coefficients(path: str | Path | None = None) -> tuple[float, dict[str, float]]:
+
+def _normalize_header(name: object) -> str:
+    return _HEADER_SEPARATORS_RE.sub("", str(name).lower())
+
+
+def _find_column(columns: pd.Index, keys: tuple[str, ...]) -> object | None:
+    """First column whose normalized name contains any of ``keys``, or None."""
+    return next((c for c in columns if any(k in _normalize_header(c) for k in keys)), None)
+
+
+if _njit is not None:
+
+    # No "nnan" fast-math flag: the NaN imputation branch must survive optimization
+    @_njit(cache=True, fastmath={"reassoc", "contract"})
+    def _score(coef: np.ndarray, beta: np.ndarray, intercept: float, impute: float) -> float:
+        """Clipped intercept + coef . beta, imputing NaN betas, in one compiled loop."""
+        s = intercept
+        for i in range(coef.shape[0]):
+            b = beta[i]
+            if np.isnan(b):
+                b = impute
+            s += coef[i] * b
+        return min(120.0, max(0.0, s))
+
+else:
+
+    def _score(coef: np.ndarray, beta: np.ndarray, intercept: float, impute: float) -> float:
+        """Clipped intercept + coef . beta, imputing NaN betas (NumPy fallback)."""
+        s = intercept + coef @ np.where(np.isnan(beta), impute, beta)
+        return min(120.0, max(0.0, float(s)))
+
+
+# Illumina CpG probe label, e.g. cg16867657 (prefix match, as str.match(r"cg\d+"))
+_PROBE_LABEL_RE = re.compile(r"cg\d")
+_PROBE_LABEL_HEAD = 8
+
+
+def _has_probe_labels(labels: pd.Index) -> bool:
+    """Return True if any label looks like a CpG probe ID.
+
+    Probe axes are homogeneous, so the first few labels settle it without
+    materializing string/boolean arrays; the full scan only runs on a miss.
     """
-    Load intercept and per-probe coefficients from a CSV.
+    if any(_PROBE_LABEL_RE.match(str(x)) for x in itertools.islice(labels, _PROBE_LABEL_HEAD)):
+        return True
+    if len(labels) <= _PROBE_LABEL_HEAD:
+        return False
+    return bool(labels.astype(str).str.match(r"cg\d+", na=False).any())
 
-    CSV format: one column 'Probe' (or 'probe_id') and one 'Coefficient' (or 'coef').
-    First row can be header. Optionally a row with Probe='Intercept' for intercept;
-    otherwise intercept is assumed 0.
 
-    Returns:
-        (intercept, dict of probe_id -> coefficient)
+@functools.lru_cache(maxsize=8)
+def _load_horvath_coefficients_cached(
+    path_str: str, mtime_ns: int
+) -> tuple[float, tuple[str, ...], np.ndarray]:
+    """
+    Parse a Horvath coefficient CSV (cached on resolved path + mtime).
+
+    Returns immutable containers so the cached value can be shared safely:
+        (intercept, tuple of probe_ids, read-only float64 array of coefficients)
     """
-    path = path or _DEFAULT_COEF_PATH
-    path = Path(path)
+    path = Path(path_str)
     intercept = 0.0
-    coefs = {}
+
+    # Peek at the header only (nrows=0) to decide the layout before parsing rows.
+    # gb-2013-14-10-r115-S3.csv has 2 leading comment/empty lines, then CpGmarker,CoefficientTraining,...
+    skip = 0
+    columns = pd.read_csv(path, nrows=0).columns
+    if _find_column(columns, _HEADER_KEYS) is None:
+        skip = 2
+        columns = pd.read_csv(path, skiprows=skip, nrows=0).columns
+
+    probe_col = _find_column(columns, _PROBE_COLUMN_KEYS)
+    probe_col = columns[0] if probe_col is None else probe_col
+    coef_col = _find_column(columns, _COEF_COLUMN_KEYS)
+    coef_col = columns[1] if coef_col is None else coef_col
+    # Only the two needed columns are parsed; probe IDs stay strings
+    df = pd.read_csv(path, skiprows=skip, usecols=[probe_col, coef_col], dtype={probe_col: str})
+
+    probes = df[probe_col].astype(str).str.strip().to_numpy(dtype=str)
+    vals = pd.to_numeric(df[coef_col], errors="coerce").to_numpy(dtype=np.float64)
+    keep = np.isfinite(vals) & (probes != "") & ~np.char.startswith(probes, "#")
+    is_intercept = np.char.strip(np.char.lower(probes), "()") == "intercept"
+
+    hits = np.flatnonzero(keep & is_intercept)
+    if hits.size:
+        intercept = float(vals[hits[-1]])
+    mask = keep & ~is_intercept
+    coef_arr = vals[mask].copy()
+    coef_arr.flags.writeable = False
+    return intercept, tuple(probes[mask].tolist()), coef_arr
+
+
+def _horvath_coefficient_arrays(
+    path: str | Path | None = None,
+) -> tuple[float, tuple[str, ...], np.ndarray]:
+    """Resolve ``path`` and return cached (intercept, probe_ids, coefficients)."""
+    path = Path(path or _DEFAULT_COEF_PATH)
 
     if not path.exists():
         raise FileNotFoundError(
@@ -50,34 +146,23 @@ def _load_horvath_coefficients(path: str | Path | None = None) -> tuple[float, d
             " or from the paper supplementary (Table S2), and save as CSV with columns 'Probe' and 'Coefficient'."
         )
 
-    # gb-2013-14-10-r115-S3.csv has 2 leading comment/empty lines, then CpGmarker,CoefficientTraining,...
-    with open(path, encoding="utf-8") as f:
-        first_line = f.readline()
-    skip = 2 if "CpGmarker" not in first_line and "probe" not in first_line.lower() else 0
-    df = pd.read_csv(path, skiprows=range(skip) if skip else None)
-    probe_col = next(
-        (c for c in df.columns if "probe" in c.lower() or "cg" in c.lower() or c == "CpGmarker"),
-        df.columns[0],
-    )
-    coef_col = next(
-        (c for c in df.columns if "coefficient" in c.lower() or "coef" in c.lower() or "weight" in c.lower()),
-        df.columns[1],
-    )
-
-    for _, row in df.iterrows():
-        probe = str(row[probe_col]).strip()
-        if not probe or probe.startswith("#"):
-            continue
-        try:
-            val = float(row[coef_col])
-        except (TypeError, ValueError):
-            continue
-        if probe.lower().strip("()") == "intercept":
-            intercept = val
-        else:
-            coefs[probe] = val
+    resolved = path.resolve()
+    return _load_horvath_coefficients_cached(str(resolved), resolved.stat().st_mtime_ns)
+
+
+def _load_horvath_coefficients(path: str | Path | None = None) -> tuple[float, dict[str, float]]:
+    """
+    Load intercept and per-probe coefficients from a CSV.
+
+    CSV format: one column 'Probe' (or 'probe_id') and one 'Coefficient' (or 'coef').
+    First row can be header. Optionally a row with Probe='Intercept' for intercept;
+    otherwise intercept is assumed 0. Parsed files are cached until their mtime changes.
 
-    return intercept, coefs
+    Returns:
+        (intercept, dict of probe_id -> coefficient)
+    """
+    intercept, probes, coef_arr = _horvath_coefficient_arrays(path)
+    return intercept, dict(zip(probes, coef_arr.tolist(), strict=True))
 
 
 class HorvathClock:
@@ -89,19 +174,17 @@ class HorvathClock:
     """
 
     def __init__(self, coefficient_path: str | Path | None = None):
-        self.intercept, self.coefficients = _load_horvath_coefficients(coefficient_path)
-        self.probe_ids = list(self.coefficients.keys())
+        self.intercept, probes, self.coef_arr = _horvath_coefficient_arrays(coefficient_path)
+        self.coefficients = dict(zip(probes, self.coef_arr.tolist(), strict=True))
+        # probe_ids is aligned with coef_arr so prediction is a single dot product
+        self.probe_ids = np.array(probes)
 
     def _single_sample_age(self, beta: dict[str, float], missing_impute: float = 0.5) -> float:
         """Predict DNAm age for one sample given probe_id -> beta."""
-        raw = self.intercept
-        for probe, coef in self.coefficients.items():
-            b = beta.get(probe)
-            if b is None or (isinstance(b, float) and np.isnan(b)):
-                b = missing_impute
-            raw += coef * float(b)
-        # Clip to plausible human age range (Horvath output can exceed calendar age)
-        return float(np.clip(raw, 0.0, 120.0))
+        # None -> NaN under float64 conversion; _score imputes NaN with missing_impute
+        b = np.array([beta.get(p) for p in self.probe_ids], dtype=np.float64)
+        # Clipped to plausible human age range (Horvath output can exceed calendar age)
+        return float(_score(self.coef_arr, b, self.intercept, missing_impute))
 
     def predict(
         self,
@@ -130,29 +213,33 @@ class HorvathClock:
 
         df = pd.DataFrame(beta)
         # DataFrame: assume either (probes x samples) or (samples x probes)
-        if df.index.astype(str).str.match(r"cg\d+", na=False).any():
+        if _has_probe_labels(df.index):
             # Rows = probes
-            probe_axis, sample_axis = 0, 1
-        elif df.columns.astype(str).str.match(r"cg\d+", na=False).any():
+            probe_axis = 0
+        elif _has_probe_labels(df.columns):
             # Columns = probes
-            probe_axis, sample_axis = 1, 0
+            probe_axis = 1
         else:
             raise ValueError(
                 "DataFrame must have probe IDs (e.g. cg16867657) as index or column names."
             )
 
-        if probe_axis == 0:
-            # rows = probes
-            ages = []
-            for col in df.columns:
-                ages.append(self._single_sample_age(df[col].to_dict(), missing_impute))
-            return np.array(ages)
+        # Canonicalize to probes x samples, then score every sample in one matmul.
+        # Selecting the clock's probes first means a full 450K/EPIC input is cut
+        # down to 353 probes before anything is copied or transposed.
+        # Repeated probe IDs keep their last value (as the per-sample dict lookups did);
+        # reindex itself refuses duplicate labels.
+        if probe_axis == 1:
+            df = df.loc[:, ~df.columns.duplicated(keep="last")]
+            df = df.reindex(columns=self.probe_ids).T
         else:
-            # columns = probes
-            ages = []
-            for _, row in df.iterrows():
-                ages.append(self._single_sample_age(row.to_dict(), missing_impute))
-            return np.array(ages)
+            df = df[~df.index.duplicated(keep="last")]
+            df = df.reindex(self.probe_ids)
+        mat = df.to_numpy(dtype=np.float64, copy=True)
+        mat[np.isnan(mat)] = missing_impute
+        ages = self.intercept + self.coef_arr @ mat
+        np.clip(ages, 0.0, 120.0, out=ages)
+        return ages
 
     def __len__(self) -> int:
         return len(self.coefficients)
@@ -190,25 +277,42 @@ _TEST_DATA_DIR = Path(__file__).resolve().parent.parent.parent / "test_data"
 _COEF_FILE = "gb-2013-14-10-r115-S3.csv"
 
 
+_TEST_BETA_COLUMNS = ("medianByCpG", "medianByCpGYoung", "medianByCpGOld")
+
+
+@functools.lru_cache(maxsize=8)
+def _load_test_betas_cached(
+    path_str: str, beta_cols: tuple[str, ...], mtime_ns: int
+) -> tuple[tuple[str, tuple[tuple[str, float], ...]], ...]:
+    """Parse beta columns from the coefficient CSV in one pass (cached on path, columns and mtime)."""
+    probe_col = "CpGmarker"
+    columns = pd.read_csv(path_str, skiprows=2, nrows=0).columns
+    for beta_col in beta_cols:
+        if beta_col not in columns:
+            raise ValueError(f"Column {beta_col!r} not in CSV. Available: {list(columns)}")
+    df = pd.read_csv(path_str, skiprows=2, usecols=[probe_col, *beta_cols], dtype={probe_col: str})
+    probes = df[probe_col].astype(str).str.strip().to_numpy(dtype=str)
+    valid_probe = (probes != "") & (np.char.strip(np.char.lower(probes), "()") != "intercept")
+    out = []
+    for beta_col in beta_cols:
+        vals = pd.to_numeric(df[beta_col], errors="coerce").to_numpy(dtype=np.float64)
+        mask = valid_probe & ~np.isnan(vals)
+        out.append((beta_col, tuple(zip(probes[mask].tolist(), vals[mask].tolist(), strict=True))))
+    return tuple(out)
+
+
+def _load_all_test_betas(
+    path: Path, beta_cols: tuple[str, ...] = _TEST_BETA_COLUMNS
+) -> dict[str, dict[str, float]]:
+    """Load several beta columns from the coefficient CSV with a single parse."""
+    resolved = Path(path).resolve()
+    parsed = _load_test_betas_cached(str(resolved), tuple(beta_cols), resolved.stat().st_mtime_ns)
+    return {col: dict(items) for col, items in parsed}
+
+
 def _load_test_betas_from_csv(path: Path, beta_col: str = "medianByCpG") -> dict[str, float]:
     """Load methylation beta values from the coefficient CSV (e.g. medianByCpG, medianByCpGYoung, medianByCpGOld)."""
-    df = pd.read_csv(path, skiprows=range(2))
-    probe_col = "CpGmarker"
-    if beta_col not in df.columns:
-        raise ValueError(f"Column {beta_col!r} not in CSV. Available: {list(df.columns)}")
-    beta = {}
-    for _, row in df.iterrows():
-        probe = str(row[probe_col]).strip()
-        if not probe or probe.lower().strip("()") == "intercept":
-            continue
-        val = row[beta_col]
-        if pd.isna(val):
-            continue
-        try:
-            beta[probe] = float(val)
-        except (TypeError, ValueError):
-            continue
-    return beta
+    return _load_all_test_betas(path, (beta_col,))[beta_col]
 
 
 if __name__ == "__main__":
@@ -225,20 +329,23 @@ if __name__ == "__main__":
     clock = HorvathClock(coefficient_path=coef_path)
     print(f"Loaded {len(clock)} CpG coefficients, intercept = {clock.intercept:.4f}")
 
+    # One CSV parse for all three beta columns
+    test_betas = _load_all_test_betas(coef_path, _TEST_BETA_COLUMNS)
+
     # Test: beta values from CSV (medianByCpG = median methylation in training set)
-    beta_median = _load_test_betas_from_csv(coef_path, "medianByCpG")
+    beta_median = test_betas["medianByCpG"]
     print(f"Loaded {len(beta_median)} beta values from CSV (medianByCpG)")
     age_median = clock.predict(beta_median, missing_impute=0.5)
     print(f"DNAm age (medianByCpG): {age_median:.2f} years")
 
     # Test: medianByCpGYoung (median methylation in young subset)
-    beta_young = _load_test_betas_from_csv(coef_path, "medianByCpGYoung")
+    beta_young = test_betas["medianByCpGYoung"]
     print(f"Loaded {len(beta_young)} beta values from CSV (medianByCpGYoung)")
     age_young = clock.predict(beta_young, missing_impute=0.5)
     print(f"DNAm age (medianByCpGYoung): {age_young:.2f} years")
 
     # Test: medianByCpGOld (median methylation in old subset)
-    beta_old = _load_test_betas_from_csv(coef_path, "medianByCpGOld")
+    beta_old = test_betas["medianByCpGOld"]
     print(f"Loaded {len(beta_old)} beta values from CSV (medianByCpGOld)")
     age_old = clock.predict(beta_old, missing_impute=0.5)
     print(f"DNAm age (medianByCpGOld): {age_old:.2f} years")
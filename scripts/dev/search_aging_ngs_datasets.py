@@ -5,7 +5,9 @@ Search public databases for NGS sequencing datasets relevant to aging.
 Uses NCBI SRA (Sequence Read Archive) via E-utilities. Results are annotated
 with whether each dataset was generated with Oxford Nanopore or another platform.
 
-Output: CSV table with accession, title, platform, is_oxford_nanopore, and related fields.
+Output: CSV table with accession, title, platform, is_oxford_nanopore, and related fields,
+plus a Nanopore-only CSV filtered from the same results (or, with
+--separate-nanopore-query, from a second Nanopore-restricted search).
 
 Usage:
     python search_aging_ngs_datasets.py [--max-results N] [--output FILE]
@@ -18,13 +20,26 @@ from __future__ import annotations
 
 import csv
 import os
+import re
 import sys
+import threading
 import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import partial
 from pathlib import Path
 from xml.etree import ElementTree as ET
 
 import requests
 import typer
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
+
+try:  # lxml is optional: C-accelerated parsing + precompiled XPath when available
+    from lxml import etree as _lxml_etree
+except ImportError:  # pragma: no cover - depends on environment
+    _lxml_etree = None
 
 # NCBI E-utilities base URL
 EUTILS_BASE = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
@@ -50,6 +65,104 @@ OXFORD_NANOPORE_INDICATORS = (
     "flongle",
 )
 
+# One compiled alternation per lookup instead of a Python-level scan per indicator
+_NANOPORE_RE = re.compile("|".join(re.escape(s) for s in OXFORD_NANOPORE_INDICATORS), re.IGNORECASE)
+_PLATFORM_RE = re.compile(r"illumina|pac ?bio|ion torrent|bgiseq|mgi", re.IGNORECASE)
+_PLATFORM_LABELS = {
+    "illumina": "Illumina",
+    "pacbio": "PacBio",
+    "pac bio": "PacBio",
+    "ion torrent": "Ion Torrent",
+    "bgiseq": "MGI/BGI",
+    "mgi": "MGI/BGI",
+}
+
+if _lxml_etree is not None:
+    _iterparse = _lxml_etree.iterparse
+    _ITEM_XPATH = _lxml_etree.XPath("./Item")
+    # Non-empty Run/Runs List items, matching Name case-insensitively
+    _RUNS_LIST_XPATH = _lxml_etree.XPath(
+        "./Item[@Type='List'][Item]"
+        "[translate(@Name, 'RUNS', 'runs') = 'runs' or translate(@Name, 'RUNS', 'runs') = 'run']"
+    )
+    XML_PARSE_ERRORS: tuple[type[Exception], ...] = (ET.ParseError, _lxml_etree.XMLSyntaxError)
+else:
+    _iterparse = ET.iterparse
+
+    def _ITEM_XPATH(el):  # noqa: N802 - mirrors the compiled lxml XPath callable
+        return el.findall("Item")
+
+    def _RUNS_LIST_XPATH(el):  # noqa: N802
+        return [
+            item
+            for item in el.findall("Item")
+            if item.get("Type") == "List"
+            and (item.get("Name") or "").lower() in ("runs", "run")
+            and item.find("Item") is not None
+        ]
+
+    XML_PARSE_ERRORS = (ET.ParseError,)
+
+# Network failures: requests wraps most, but errors while iterparse reads r.raw mid-body
+# (dropped connection, read timeout) surface as urllib3 ProtocolError / ReadTimeoutError.
+FETCH_ERRORS: tuple[type[Exception], ...] = (requests.RequestException, Urllib3HTTPError)
+
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# NCBI E-utilities limits: 3 requests/s without an API key, 10 with one
+NCBI_MIN_INTERVAL_SEC = 1 / 3
+NCBI_MIN_INTERVAL_WITH_KEY_SEC = 1 / 10
+
+
+class _RateLimiter:
+    """Thread-safe minimum-interval limiter shared by all E-utilities requests."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self, api_key: str | None = None) -> None:
+        """Block until this caller's request slot (reserved under the lock) opens."""
+        interval = NCBI_MIN_INTERVAL_WITH_KEY_SEC if api_key else NCBI_MIN_INTERVAL_SEC
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def _build_session() -> requests.Session:
+    """Shared E-utilities session: pooled keep-alive connections plus retry backoff."""
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=RETRYABLE_STATUS_CODES,
+        allowed_methods=frozenset({"GET"}),
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+    session.headers.update({"User-Agent": "aging-ngs-search/1.0"})
+    return session
+
+
+# Reused by every request so the TLS handshake to eutils is paid once per run
+_SESSION = _build_session()
+_RATE_LIMITER = _RateLimiter()
+
+# DocSum item names tried, in order, for the description column
+_DESCRIPTION_KEYS = ("Summary", "Abstract", "Design", "title")
+
+# Every DocSum Item name read when building an output row
+_WANTED_ITEM_NAMES = frozenset(
+    (
+        "Run", "Accession", "Experiment", "Study", "Title",
+        "Platform", "PlatformInstrument", "Organism", "OrganismScientificName", "StudyAcc",
+        *_DESCRIPTION_KEYS,
+        "RunCount", "total_runs", "n_runs",
+    )
+)
+
 DEFAULT_OUTPUT = Path(__file__).resolve().parent / "aging_ngs_datasets.csv"
 
 app = typer.Typer(add_completion=False, help=__doc__)
@@ -64,8 +177,7 @@ def is_oxford_nanopore(platform_str: str | None) -> bool:
     """Return True if the platform string indicates Oxford Nanopore sequencing."""
     if not platform_str or not isinstance(platform_str, str):
         return False
-    lower = platform_str.lower().strip()
-    return any(ind in lower for ind in OXFORD_NANOPORE_INDICATORS)
+    return _NANOPORE_RE.search(platform_str) is not None
 
 
 def normalize_platform(platform_str: str | None) -> str:
@@ -76,14 +188,9 @@ def normalize_platform(platform_str: str | None) -> str:
     if is_oxford_nanopore(s):
         return "Oxford Nanopore"
     # Common SRA platform values
-    if "illumina" in s.lower():
-        return "Illumina"
-    if "pacbio" in s.lower() or "pac bio" in s.lower():
-        return "PacBio"
-    if "ion torrent" in s.lower():
-        return "Ion Torrent"
-    if "bgiseq" in s.lower() or "mgi" in s.lower():
-        return "MGI/BGI"
+    m = _PLATFORM_RE.search(s)
+    if m is not None:
+        return _PLATFORM_LABELS[m.group(0).lower()]
     return s or "unknown"
 
 
@@ -102,7 +209,8 @@ def search_sra(
     if api_key:
         params["api_key"] = api_key
 
-    r = requests.get(f"{EUTILS_BASE}/esearch.fcgi", params=params, timeout=30)
+    _RATE_LIMITER.wait(api_key)
+    r = _SESSION.get(f"{EUTILS_BASE}/esearch.fcgi", params=params, timeout=30)
     r.raise_for_status()
     data = r.json()
     id_list = data.get("esearchresult", {}).get("idlist", [])
@@ -120,17 +228,18 @@ def _sra_link(accession: str, uid: str) -> str:
 
 def _description_from_items(item_map: dict, title: str, max_len: int = 2000) -> str:
     """Extract description from SRA summary items (Summary, Abstract, Design, Title)."""
-    raw = (
-        item_map.get("Summary")
-        or item_map.get("Abstract")
-        or item_map.get("Design")
-        or item_map.get("title")
-        or title
-    )
-    if not raw or not isinstance(raw, str):
+    for key in _DESCRIPTION_KEYS:
+        raw = item_map.get(key)
+        if raw:
+            break
+    else:
+        raw = title
+    if not isinstance(raw, str):
         return ""
     s = raw.strip()
-    return s[:max_len] + ("..." if len(s) > max_len else "")
+    if len(s) > max_len:
+        return s[:max_len] + "..."
+    return s
 
 
 def _number_of_samples_from_doc(doc: ET.Element, item_map: dict, accession: str) -> str:
@@ -140,17 +249,58 @@ def _number_of_samples_from_doc(doc: ET.Element, item_map: dict, accession: str)
     if run_count is not None and str(run_count).strip().isdigit():
         return str(int(run_count))
     # Count Run items in a List (e.g. Item Name="Runs" Type="List" with Item children)
-    for item in doc.findall("Item"):
-        if item.get("Type") == "List" and (item.get("Name") or "").lower() in ("runs", "run"):
-            children = item.findall("Item")
-            if children:
-                return str(len(children))
+    runs_lists = _RUNS_LIST_XPATH(doc)
+    if runs_lists:
+        return str(len(_ITEM_XPATH(runs_lists[0])))
     # Single run/experiment record → 1 sample
     if (item_map.get("Run") or accession or "").strip():
         return "1"
     return ""
 
 
+def _summary_from_doc(doc: ET.Element) -> dict:
+    """Convert one SRA ``DocSum`` element into an output row dict."""
+    uid_el = doc.find("Id")
+    uid = uid_el.text if uid_el is not None else ""
+    # Only the Items read below are kept; List items are handled separately
+    item_map = {
+        name: item.text or ""
+        for item in _ITEM_XPATH(doc)
+        if (name := item.get("Name")) in _WANTED_ITEM_NAMES and item.get("Type") != "List"
+    }
+
+    # Prefer Run accession (SRR), then Experiment (SRX), then Study (SRP)
+    accession = (
+        item_map.get("Run") or item_map.get("Accession") or item_map.get("Experiment") or item_map.get("Study") or uid
+    )
+    title = item_map.get("Title") or item_map.get("Run") or ""
+    platform = item_map.get("Platform") or item_map.get("PlatformInstrument") or ""
+    organism = item_map.get("Organism") or item_map.get("OrganismScientificName") or ""
+    study = item_map.get("Study") or item_map.get("StudyAcc") or ""
+
+    # Low-cardinality values repeat across thousands of DocSums; share one copy each
+    platform = sys.intern(platform)
+    organism = sys.intern(organism)
+
+    description = _description_from_items(item_map, title)
+    number_of_samples = _number_of_samples_from_doc(doc, item_map, accession)
+    link = _sra_link(accession, uid)
+
+    return {
+        "uid": uid,
+        "accession": accession,
+        "title": title,
+        "description": description,
+        "platform_raw": platform,
+        "platform": sys.intern(normalize_platform(platform)),
+        "is_oxford_nanopore": is_oxford_nanopore(platform),
+        "organism": organism,
+        "study_accession": study,
+        "number_of_samples": number_of_samples,
+        "link": link,
+    }
+
+
 def fetch_sra_summaries(
     uid_list: list[str],
     api_key: str | None = None,
@@ -167,51 +317,55 @@ def fetch_sra_summaries(
     if api_key:
         params["api_key"] = api_key
 
-    r = requests.get(f"{EUTILS_BASE}/esummary.fcgi", params=params, timeout=60)
-    r.raise_for_status()
-    root = ET.fromstring(r.content)
-
     results = []
-    for doc in root.findall(".//DocSum"):
-        uid_el = doc.find("Id")
-        uid = uid_el.text if uid_el is not None else ""
-        item_map = {}
-        for item in doc.findall("Item"):
-            name = item.get("Name")
-            if name is not None and item.get("Type") != "List":
-                item_map[name] = item.text or ""
-
-        # Prefer Run accession (SRR), then Experiment (SRX), then Study (SRP)
-        accession = (
-            item_map.get("Run") or item_map.get("Accession") or item_map.get("Experiment") or item_map.get("Study") or uid
-        )
-        title = item_map.get("Title") or item_map.get("Run") or ""
-        platform = item_map.get("Platform") or item_map.get("PlatformInstrument") or ""
-        organism = item_map.get("Organism") or item_map.get("OrganismScientificName") or ""
-        study = item_map.get("Study") or item_map.get("StudyAcc") or ""
-        if not platform and "Platform" in str(item_map):
-            platform = item_map.get("Platform", "")
-
-        description = _description_from_items(item_map, title)
-        number_of_samples = _number_of_samples_from_doc(doc, item_map, accession)
-        link = _sra_link(accession, uid)
-
-        results.append({
-            "uid": uid,
-            "accession": accession,
-            "title": title,
-            "description": description,
-            "platform_raw": platform,
-            "platform": normalize_platform(platform),
-            "is_oxford_nanopore": is_oxford_nanopore(platform),
-            "organism": organism,
-            "study_accession": study,
-            "number_of_samples": number_of_samples,
-            "link": link,
-        })
+    _RATE_LIMITER.wait(api_key)
+    # Stream the response and convert each DocSum as soon as it closes, so peak
+    # memory is bounded by one document instead of the whole result set.
+    with _SESSION.get(f"{EUTILS_BASE}/esummary.fcgi", params=params, timeout=60, stream=True) as r:
+        r.raise_for_status()
+        r.raw.decode_content = True
+        for _event, elem in _iterparse(r.raw, events=("end",)):
+            if elem.tag != "DocSum":
+                continue
+            results.append(_summary_from_doc(elem))
+            elem.clear()
+            if _lxml_etree is not None:
+                # Drop already-processed siblings still referenced by the root
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
     return results
 
 
+def _run_labelled[T](calls: dict[str, Callable[[], T]]) -> Iterator[tuple[str, Future[T]]]:
+    """Run labelled calls and yield ``(label, finished future)`` as each completes.
+
+    Two or more calls run concurrently (the shared rate limiter keeps them within NCBI's
+    request budget); a single call runs inline without a thread pool.
+    """
+    if len(calls) < 2:
+        for label, call in calls.items():
+            fut: Future[T] = Future()
+            try:
+                fut.set_result(call())
+            except Exception as e:
+                fut.set_exception(e)
+            yield label, fut
+        return
+    with ThreadPoolExecutor(max_workers=len(calls)) as ex:
+        futures = {ex.submit(call): label for label, call in calls.items()}
+        for fut in as_completed(futures):
+            yield futures[fut], fut
+
+
+def write_rows_csv(path: Path, fieldnames: list[str], rows: list[dict]) -> None:
+    """Write ``rows`` to ``path`` in ``fieldnames`` order; extra keys are ignored."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(fieldnames)
+        # Plain sequences in fixed field order avoid DictWriter's per-row dispatch
+        w.writerows([r.get(k, "") for k in fieldnames] for r in rows)
+
+
 def build_search_query(
     extra_terms: list[str] | None = None,
     nanopore_only: bool = False,
@@ -257,6 +411,14 @@ def main(
         "--query",
         help="Override search query (default: built-in aging + sequencing terms)",
     ),
+    separate_nanopore_query: bool = typer.Option(
+        False,
+        "--separate-nanopore-query",
+        help=(
+            "Run a second Nanopore-restricted SRA search for the Nanopore CSV instead of "
+            "filtering the main result set on is_oxford_nanopore"
+        ),
+    ),
 ) -> None:
     """Search NCBI SRA for aging-related NGS datasets and mark Oxford Nanopore."""
     # Default nanopore-only path: e.g. aging_ngs_datasets.csv -> aging_ngs_datasets_nanopore_only.csv
@@ -272,81 +434,75 @@ def main(
         "accession", "title", "description", "link", "number_of_samples",
         "platform", "platform_raw", "is_oxford_nanopore", "organism", "study_accession",
     ]
-    header_line = ",".join(fieldnames) + "\n"
     output.parent.mkdir(parents=True, exist_ok=True)
 
     # Search 1: all aging-related NGS datasets (no platform filter)
     query_all = query or build_search_query(nanopore_only=False)
     print(f"Query (all): {query_all[:100]}...", file=sys.stderr)
-    print("Searching SRA (all datasets)...", file=sys.stderr)
-    try:
-        uid_list_all = search_sra(query_all, max_results=max_results, api_key=api_key)
-    except requests.RequestException as e:
-        print(f"ERROR: SRA search failed: {e}", file=sys.stderr)
-        raise typer.Exit(code=1) from e
-
-    # Search 2: same aging terms but restrict to Oxford Nanopore at search time
-    if query:
-        query_nanopore = query + ' AND (nanopore OR "Oxford Nanopore")'
-    else:
-        query_nanopore = build_search_query(nanopore_only=True)
-    print(f"Query (Nanopore only): {query_nanopore[:100]}...", file=sys.stderr)
-    print("Searching SRA (Oxford Nanopore filter)...", file=sys.stderr)
-    time.sleep(0.35)
-    try:
-        uid_list_nanopore = search_sra(query_nanopore, max_results=max_results, api_key=api_key)
-    except requests.RequestException as e:
-        print(f"ERROR: SRA search (nanopore) failed: {e}", file=sys.stderr)
-        raise typer.Exit(code=1) from e
-
-    if not uid_list_all and not uid_list_nanopore:
-        print("No results found for either search.", file=sys.stderr)
-        with open(output, "w", newline="", encoding="utf-8") as f:
-            f.write(header_line)
-        with open(nanopore_output, "w", newline="", encoding="utf-8") as f:
-            f.write(header_line)
-        raise typer.Exit(code=0)
-
-    # Fetch summaries and write CSV for all datasets
-    rows_all: list[dict] = []
-    if uid_list_all:
-        print(f"Found {len(uid_list_all)} IDs (all). Fetching summaries...", file=sys.stderr)
-        time.sleep(0.35)
+    searches = [("all", query_all)]
+    if separate_nanopore_query:
+        # Search 2 (opt-in): same aging terms but restrict to Oxford Nanopore at search time
+        if query:
+            query_nanopore = query + ' AND (nanopore OR "Oxford Nanopore")'
+        else:
+            query_nanopore = build_search_query(nanopore_only=True)
+        print(f"Query (Nanopore only): {query_nanopore[:100]}...", file=sys.stderr)
+        searches.append(("nanopore", query_nanopore))
+
+    print("Searching SRA...", file=sys.stderr)
+    search_calls = {
+        label: partial(search_sra, q, max_results=max_results, api_key=api_key)
+        for label, q in searches
+    }
+    uid_lists: dict[str, list[str]] = {}
+    for label, fut in _run_labelled(search_calls):
         try:
-            rows_all = fetch_sra_summaries(uid_list_all, api_key=api_key)
-        except (requests.RequestException, ET.ParseError) as e:
-            kind = "Fetch summaries failed" if isinstance(e, requests.RequestException) else "Failed to parse SRA response"
-            print(f"ERROR: {kind}: {e}", file=sys.stderr)
+            uid_lists[label] = fut.result()
+        except requests.RequestException as e:
+            suffix = "" if label == "all" else f" ({label})"
+            print(f"ERROR: SRA search{suffix} failed: {e}", file=sys.stderr)
             raise typer.Exit(code=1) from e
 
-    with open(output, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-        w.writeheader()
-        w.writerows(rows_all)
+    if not any(uid_lists.values()):
+        print("No results found.", file=sys.stderr)
+        write_rows_csv(output, fieldnames, [])
+        write_rows_csv(nanopore_output, fieldnames, [])
+        raise typer.Exit(code=0)
 
-    # Fetch summaries and write CSV for Nanopore-only (from second search, not filtered in memory)
-    rows_nanopore: list[dict] = []
-    if uid_list_nanopore:
-        print(f"Found {len(uid_list_nanopore)} IDs (Nanopore). Fetching summaries...", file=sys.stderr)
-        time.sleep(0.35)
+    found = ", ".join(f"{len(uids)} IDs ({label})" for label, uids in uid_lists.items())
+    print(f"Found {found}. Fetching summaries...", file=sys.stderr)
+    # Searches that came back empty have nothing to fetch
+    rows_by_label: dict[str, list[dict]] = {label: [] for label in uid_lists}
+    fetch_calls = {
+        label: partial(fetch_sra_summaries, uids, api_key=api_key)
+        for label, uids in uid_lists.items()
+        if uids
+    }
+    for label, fut in _run_labelled(fetch_calls):
         try:
-            rows_nanopore = fetch_sra_summaries(uid_list_nanopore, api_key=api_key)
-        except (requests.RequestException, ET.ParseError) as e:
+            rows_by_label[label] = fut.result()
+        except (*FETCH_ERRORS, *XML_PARSE_ERRORS) as e:
+            suffix = "" if label == "all" else f" ({label})"
             kind = (
-                "Fetch summaries (nanopore) failed"
-                if isinstance(e, requests.RequestException)
-                else "Failed to parse SRA response (nanopore)"
+                f"Fetch summaries{suffix} failed"
+                if isinstance(e, FETCH_ERRORS)
+                else f"Failed to parse SRA response{suffix}"
             )
             print(f"ERROR: {kind}: {e}", file=sys.stderr)
             raise typer.Exit(code=1) from e
+    rows_all = rows_by_label["all"]
+    if separate_nanopore_query:
+        rows_nanopore = rows_by_label["nanopore"]
+    else:
+        # Every row already carries is_oxford_nanopore; no second round-trip needed
+        rows_nanopore = [r for r in rows_all if r["is_oxford_nanopore"]]
 
-    with open(nanopore_output, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-        w.writeheader()
-        w.writerows(rows_nanopore)
+    write_rows_csv(output, fieldnames, rows_all)
+    write_rows_csv(nanopore_output, fieldnames, rows_nanopore)
 
     print(f"Wrote {len(rows_all)} records to {output}", file=sys.stderr)
-    print(f"Wrote {len(rows_nanopore)} records (Nanopore search) to {nanopore_output}", file=sys.stderr)
+    source = "Nanopore search" if separate_nanopore_query else "Nanopore subset"
+    print(f"Wrote {len(rows_nanopore)} records ({source}) to {nanopore_output}", file=sys.stderr)
 
 
 if __name__ == "__main__":
@@ -9,6 +9,8 @@ per the rule: keep data and code strictly separated.
 See: https://github.com/IBAR-ROGEN/Aging
 """
 
+import os
+import shutil
 from collections.abc import Sequence
 from pathlib import Path
 
@@ -51,6 +53,7 @@ outputs/
 """
 
 GITIGNORE_SECTION_MARKER = "# === Bioinformatics: data/code separation (setup_rogen_env.py) ==="
+_GITIGNORE_SECTION_MARKER_BYTES = GITIGNORE_SECTION_MARKER.encode()
 
 
 def create_directories(root: Path, dirs: Sequence[str]) -> list[Path]:
@@ -69,18 +72,31 @@ def ensure_gitignore(root: Path) -> bool:
     Ensure .gitignore contains the bioinformatics block.
     Appends the block if the section is not present.
     Returns True if changes were made.
+
+    The new file is written to a temporary sibling and swapped in with os.replace, so an
+    interrupted run never leaves a half-written section whose marker looks complete.
     """
     gitignore_path = root / ".gitignore"
-    content = gitignore_path.read_text() if gitignore_path.exists() else ""
+    # Byte search: no decode pass, and no failure on non-UTF-8 .gitignore files.
+    content = gitignore_path.read_bytes() if gitignore_path.exists() else b""
 
-    if GITIGNORE_SECTION_MARKER in content:
+    if _GITIGNORE_SECTION_MARKER_BYTES in content:
         return False
 
     # Append the bioinformatics section
-    to_append = "\n" + GITIGNORE_BIOINFORMATICS
+    updated = content + b"\n" + GITIGNORE_BIOINFORMATICS.encode()
     gitignore_path.parent.mkdir(parents=True, exist_ok=True)
-    with gitignore_path.open("a") as f:
-        f.write(to_append)
+    tmp_path = gitignore_path.with_name(gitignore_path.name + ".tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            f.write(updated)
+            f.flush()
+            os.fsync(f.fileno())
+        if gitignore_path.exists():
+            shutil.copymode(gitignore_path, tmp_path)
+        os.replace(tmp_path, gitignore_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
     return True
 
 
@@ -8,63 +8,94 @@ and generates a scatter plot of chronological vs epigenetic age.
 Expected CSV columns: Sample_ID, Chronological_Age, Epigenetic_Age, Phenotype_Score
 """
 
+import os
 from pathlib import Path
 
-import pandas as pd
-import seaborn as sns
+# Headless by default; seaborn/matplotlib are only imported once plotting starts.
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+import pandas as pd  # noqa: E402
 
 # ------------------------------------------------------------------------------
 # Configuration: paths relative to project root
 # ------------------------------------------------------------------------------
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 INPUT_CSV = PROJECT_ROOT / "test_data" / "mock_epigenetic_clinical.csv"
 OUTPUT_DIR = PROJECT_ROOT / "results"
 OUTPUT_PLOT = OUTPUT_DIR / "mock_eaa_plot.png"
 
+# Only the expected columns are parsed; measurements fit comfortably in float32.
+INPUT_COLUMNS = ["Sample_ID", "Chronological_Age", "Epigenetic_Age", "Phenotype_Score"]
+INPUT_DTYPES = {
+    "Sample_ID": "string",
+    "Chronological_Age": "float32",
+    "Epigenetic_Age": "float32",
+    "Phenotype_Score": "float32",
+}
+
+
 # ------------------------------------------------------------------------------
 # 1. Load data and compute EAA residuals
 # ------------------------------------------------------------------------------
-# Epigenetic Age Acceleration (EAA) = Epigenetic_Age - Chronological_Age
-# Positive values indicate "accelerated aging"; negative values indicate "slower" aging.
-df = pd.read_csv(INPUT_CSV)
-df["EAA_Residuals"] = df["Epigenetic_Age"] - df["Chronological_Age"]
+def load_data(path: Path = INPUT_CSV) -> pd.DataFrame:
+    # Epigenetic Age Acceleration (EAA) = Epigenetic_Age - Chronological_Age
+    # Positive values indicate "accelerated aging"; negative values indicate "slower" aging.
+    df = pd.read_csv(path, engine="pyarrow", usecols=INPUT_COLUMNS, dtype=INPUT_DTYPES)
+    df["EAA_Residuals"] = df["Epigenetic_Age"] - df["Chronological_Age"]
+    return df
+
 
 # ------------------------------------------------------------------------------
 # 2. Print basic descriptive statistics
 # ------------------------------------------------------------------------------
-print("=" * 60)
-print("Descriptive Statistics (mock clinical data)")
-print("=" * 60)
-print(df.describe())
-print()
-print("Row count:", len(df))
-print("Missing values per column:")
-print(df.isnull().sum())
-print("=" * 60)
+def print_summary(df: pd.DataFrame) -> None:
+    print("=" * 60)
+    print("Descriptive Statistics (mock clinical data)")
+    print("=" * 60)
+    print(df.describe())
+    print()
+    print("Row count:", len(df))
+    print("Missing values per column:")
+    print(df.isnull().sum())
+    print("=" * 60)
+
 
 # ------------------------------------------------------------------------------
 # 3. Scatter plot: Chronological Age vs Epigenetic Age
 # ------------------------------------------------------------------------------
-# Ensure output directory exists
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
-# Create scatter plot with a diagonal reference line (y = x)
-# Points above the line = accelerated aging; below = decelerated.
-sns.set_style("whitegrid")
-ax = sns.scatterplot(
-    data=df,
-    x="Chronological_Age",
-    y="Epigenetic_Age",
-    alpha=0.7,
-    edgecolor="none",
-)
-# Add diagonal reference line (perfect agreement between clocks)
-ax.axline((0, 0), slope=1, color="gray", linestyle="--", alpha=0.7, label="y = x")
-ax.set_title("Chronological Age vs Epigenetic Age")
-ax.set_xlabel("Chronological Age")
-ax.set_ylabel("Epigenetic Age")
-ax.legend()
-
-ax.figure.tight_layout()
-ax.figure.savefig(OUTPUT_PLOT, dpi=150, bbox_inches="tight")
-print(f"Plot saved to: {OUTPUT_PLOT}")
+def plot_ages(df: pd.DataFrame, output_plot: Path = OUTPUT_PLOT) -> None:
+    import seaborn as sns
+
+    # Ensure output directory exists
+    output_plot.parent.mkdir(parents=True, exist_ok=True)
+
+    # Create scatter plot with a diagonal reference line (y = x)
+    # Points above the line = accelerated aging; below = decelerated.
+    sns.set_style("whitegrid")
+    ax = sns.scatterplot(
+        data=df,
+        x="Chronological_Age",
+        y="Epigenetic_Age",
+        alpha=0.7,
+        edgecolor="none",
+    )
+    # Add diagonal reference line (perfect agreement between clocks)
+    ax.axline((0, 0), slope=1, color="gray", linestyle="--", alpha=0.7, label="y = x")
+    ax.set_title("Chronological Age vs Epigenetic Age")
+    ax.set_xlabel("Chronological Age")
+    ax.set_ylabel("Epigenetic Age")
+    ax.legend()
+
+    ax.figure.tight_layout()
+    ax.figure.savefig(output_plot, dpi=150, bbox_inches="tight")
+    print(f"Plot saved to: {output_plot}")
+
+
+def main() -> None:
+    df = load_data()
+    print_summary(df)
+    plot_ages(df)
+
+
+if __name__ == "__main__":
+    main()
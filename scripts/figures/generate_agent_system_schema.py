@@ -6,14 +6,27 @@ This script creates a visualization of the agent system architecture showing:
 - LongevityForest cluster with BioMART, AlphaFold, and STRING databases
 """
 
+import functools
+import importlib.util
 import os
 import shutil
+import sys
+from pathlib import Path
+from types import ModuleType
 
 from diagrams import Cluster, Diagram, Edge, Node
 from diagrams.onprem.client import User
 
+# Directories that commonly hold ``dot`` but may be missing from PATH (e.g. GUI launches).
+_EXTRA_GRAPHVIZ_BIN_DIRS = [
+    "/usr/local/bin",
+    "/opt/homebrew/bin",
+    "/opt/local/bin",
+    "/Applications/Graphviz.app/Contents/MacOS",
+]
 
-def find_graphviz() -> str | None:
+
+def _probe_graphviz() -> str | None:
     """Try to find Graphviz dot executable in common locations."""
     # Check if dot is already in PATH
     dot_path = shutil.which("dot")
@@ -36,6 +49,46 @@ def find_graphviz() -> str | None:
     return None
 
 
+@functools.lru_cache(maxsize=1)
+def find_graphviz() -> str | None:
+    """Locate ``dot`` once per process, extending PATH with common bin dirs only if needed."""
+    dot_path = _probe_graphviz()
+    if dot_path:
+        return dot_path
+
+    # Try to add common paths to PATH so diagrams' own ``dot`` lookup succeeds too
+    current_path = os.environ.get("PATH", "")
+    for bin_dir in _EXTRA_GRAPHVIZ_BIN_DIRS:
+        if os.path.exists(bin_dir) and bin_dir not in current_path:
+            os.environ["PATH"] = f"{bin_dir}:{current_path}"
+
+    # Check again
+    return _probe_graphviz()
+
+
+_FALLBACK_SCRIPT = Path(__file__).parent / "generate_agent_system_schema_fallback.py"
+_FALLBACK_MODULE_NAME = "generate_agent_system_schema_fallback"
+
+
+def _load_fallback_module() -> ModuleType:
+    """Import the matplotlib fallback once; later calls reuse it from ``sys.modules``.
+
+    ``scripts/`` is not a package and this file may run via the root shim, so the
+    fallback is loaded by path rather than by a normal import.
+    """
+    module = sys.modules.get(_FALLBACK_MODULE_NAME)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(_FALLBACK_MODULE_NAME, _FALLBACK_SCRIPT)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[_FALLBACK_MODULE_NAME] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[_FALLBACK_MODULE_NAME]
+            raise
+    return module
+
+
 def create_agent_system_schema(output_path: str | None = None) -> None:
     """Create Figure 4: Agent System Schema architecture diagram.
     
@@ -43,41 +96,19 @@ def create_agent_system_schema(output_path: str | None = None) -> None:
         output_path: Path to save the diagram. If None, saves to ``figures/`` directory.
     """
     # Check for Graphviz
-    dot_path = find_graphviz()
-    if not dot_path:
-        # Try to add common paths to PATH
-        common_bin_dirs = [
-            "/usr/local/bin",
-            "/opt/homebrew/bin",
-            "/opt/local/bin",
-            "/Applications/Graphviz.app/Contents/MacOS",
-        ]
-        current_path = os.environ.get("PATH", "")
-        for bin_dir in common_bin_dirs:
-            if os.path.exists(bin_dir) and bin_dir not in current_path:
-                os.environ["PATH"] = f"{bin_dir}:{current_path}"
-        
-        # Check again
-        dot_path = find_graphviz()
-        if not dot_path:
-            print("Warning: Graphviz not found. Using matplotlib fallback to generate PNG.")
-            print("To use Graphviz (better quality), install with: brew install graphviz")
-            # Use matplotlib fallback
-            from pathlib import Path
-            fallback_script = Path(__file__).parent / "generate_agent_system_schema_fallback.py"
-            if fallback_script.exists():
-                import importlib.util
-                spec = importlib.util.spec_from_file_location("fallback_module", fallback_script)
-                fallback_module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(fallback_module)
-                fallback_module.create_agent_system_schema_matplotlib(output_path)
-                return
-            else:
-                raise RuntimeError(
-                    "Graphviz not found and fallback script not available.\n"
-                    "Please install Graphviz: brew install graphviz\n"
-                    "Or download from: https://graphviz.org/download/"
-                )
+    if not find_graphviz():
+        print("Warning: Graphviz not found. Using matplotlib fallback to generate PNG.")
+        print("To use Graphviz (better quality), install with: brew install graphviz")
+        # Use matplotlib fallback
+        if _FALLBACK_SCRIPT.exists():
+            _load_fallback_module().create_agent_system_schema_matplotlib(output_path)
+            return
+        else:
+            raise RuntimeError(
+                "Graphviz not found and fallback script not available.\n"
+                "Please install Graphviz: brew install graphviz\n"
+                "Or download from: https://graphviz.org/download/"
+            )
     
     if output_path is None:
         output_dir = Path(__file__).parent.parent.parent / "figures"
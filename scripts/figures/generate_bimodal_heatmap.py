@@ -5,12 +5,17 @@ This script generates the heatmap described in Activity 2.1.7, showing the
 protective vs. risk effects of candidate longevity genes across different conditions.
 
 Usage:
-    python scripts/generate_bimodal_heatmap.py
+    python scripts/figures/generate_bimodal_heatmap.py
     or
-    uv run python scripts/generate_bimodal_heatmap.py
+    uv run python scripts/figures/generate_bimodal_heatmap.py
+
+Thin alias for ``scripts/figures/generate_viz.py --target heatmap``.
 """
 
-from rogen_aging.methylation_visualizations import create_bimodal_risk_heatmap
+import runpy
+import sys
+from pathlib import Path
 
 if __name__ == "__main__":
-    create_bimodal_risk_heatmap()
+    sys.argv[1:] = ["--target", "heatmap"]
+    runpy.run_path(str(Path(__file__).resolve().with_name("generate_viz.py")), run_name="__main__")
@@ -5,12 +5,17 @@ This script generates the scatter plot for Activity 2.1.10, showing the
 relationship between chronological age and DNAm predicted age with MAE ~ 2.1 years.
 
 Usage:
-    python scripts/generate_clock_validation.py
+    python scripts/figures/generate_clock_validation.py
     or
-    uv run python scripts/generate_clock_validation.py
+    uv run python scripts/figures/generate_clock_validation.py
+
+Thin alias for ``scripts/figures/generate_viz.py --target clock``.
 """
 
-from rogen_aging.methylation_visualizations import create_clock_validation_plot
+import runpy
+import sys
+from pathlib import Path
 
 if __name__ == "__main__":
-    create_clock_validation_plot()
+    sys.argv[1:] = ["--target", "clock"]
+    runpy.run_path(str(Path(__file__).resolve().with_name("generate_viz.py")), run_name="__main__")
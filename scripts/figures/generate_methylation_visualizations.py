@@ -7,12 +7,17 @@ This script creates three visualization files:
 3. Pipeline summary diagram
 
 Usage:
-    python scripts/generate_methylation_visualizations.py
+    python scripts/figures/generate_methylation_visualizations.py
     or
-    uv run python scripts/generate_methylation_visualizations.py
+    uv run python scripts/figures/generate_methylation_visualizations.py
+
+Thin alias for ``scripts/figures/generate_viz.py --target methylation``.
 """
 
-from rogen_aging.methylation_visualizations import generate_all_visualizations
+import runpy
+import sys
+from pathlib import Path
 
 if __name__ == "__main__":
-    generate_all_visualizations()
+    sys.argv[1:] = ["--target", "methylation"]
+    runpy.run_path(str(Path(__file__).resolve().with_name("generate_viz.py")), run_name="__main__")
@@ -7,7 +7,7 @@ This script creates a visualization of a bioinformatics pipeline showing:
 - All orchestrated by Dagster
 """
 
-import os
+import hashlib
 from pathlib import Path
 
 from diagrams import Cluster, Diagram, Edge
@@ -17,11 +17,20 @@ from diagrams.onprem.database import Duckdb
 from diagrams.programming.language import Python
 
 
-def create_pipeline_diagram(output_path: str | None = None) -> None:
+def _diagram_spec_hash() -> str:
+    """SHA-256 of this module's source, which holds every node, edge, label and color."""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+def create_pipeline_diagram(output_path: str | None = None, force: bool = False) -> None:
     """Create a professional pipeline diagram for scientific reports.
     
+    Rendering shells out to Graphviz, so it is skipped when the image exists and its
+    ``.<name>.sha256`` sidecar matches the current diagram definition.
+    
     Args:
         output_path: Path to save the diagram. If None, saves to ``figures/`` directory.
+        force: Re-render even if the cached image is up to date.
     """
     if output_path is None:
         output_dir = Path(__file__).parent.parent.parent / "figures"
@@ -36,112 +45,119 @@ def create_pipeline_diagram(output_path: str | None = None) -> None:
     output_dir_abs = output_path_abs.parent
     output_filename = output_path_abs.stem  # filename without extension
     
-    # Change to output directory so diagrams saves there
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(str(output_dir_abs))
-        
-        with Diagram(
-            "Bioinformatics Pipeline Architecture",
-            filename=output_filename,
-            show=False,
-            direction="LR",
-            graph_attr={
-                "bgcolor": "white",
-                "pad": "1.5",
-                "splines": "ortho",
-                "nodesep": "1.0",
-                "ranksep": "1.5",
-                "fontsize": "16",
-                "fontname": "Arial",
-                "labeljust": "l",
-            },
-            node_attr={
-                "fontsize": "11",
-                "fontname": "Arial",
-                "shape": "box",
-                "style": "rounded,filled",
-                "fillcolor": "lightblue",
-            },
-        ):
-            with Cluster("Dagster Orchestration", graph_attr={
-                "bgcolor": "lightgray",
-                "style": "rounded,filled",
-                "labeljust": "l",
-                "fontsize": "14",
-                "fontname": "Arial Bold",
-            }):
-                # Input: Nanopore pod5
-                pod5 = Storage(
-                    "Nanopore\npod5",
-                    **{"fillcolor": "#E8F4F8", "style": "rounded,filled"}
-                )
-                
-                # Processing tools
-                dorado = Python(
-                    "Dorado\nBasecalling",
-                    **{"fillcolor": "#4ECDC4", "style": "rounded,filled"}
-                )
-                modkit = Python(
-                    "Modkit\nMethylation\nCalling",
-                    **{"fillcolor": "#4ECDC4", "style": "rounded,filled"}
-                )
-                
-                # Storage: Apache Parquet
-                parquet = Storage(
-                    "Apache\nParquet\nStorage",
-                    **{"fillcolor": "#FFE66D", "style": "rounded,filled"}
-                )
-                
-                # Query engines
-                polars = SQL(
-                    "Polars\nQuery Engine",
-                    **{"fillcolor": "#95E1D3", "style": "rounded,filled"}
-                )
-                duckdb = Duckdb(
-                    "DuckDB\nQuery Engine",
-                    **{"fillcolor": "#95E1D3", "style": "rounded,filled"}
-                )
-                
-                # Flow connections - processing pipeline
-                pod5 >> Edge(
-                    label="Raw reads",
-                    style="bold",
-                    color="#2C3E50",
-                    penwidth="2.5"
-                ) >> dorado
-                
-                dorado >> Edge(
-                    label="BAM files",
-                    style="bold",
-                    color="#27AE60",
-                    penwidth="2.5"
-                ) >> modkit
-                
-                modkit >> Edge(
-                    label="Methylation calls",
-                    style="bold",
-                    color="#E74C3C",
-                    penwidth="2.5"
-                ) >> parquet
-                
-                # Query connections - parallel querying
-                parquet >> Edge(
-                    label="Query",
-                    style="dashed",
-                    color="#7F8C8D",
-                    penwidth="2.0"
-                ) >> polars
-                
-                parquet >> Edge(
-                    label="Query",
-                    style="dashed",
-                    color="#7F8C8D",
-                    penwidth="2.0"
-                ) >> duckdb
-    finally:
-        os.chdir(original_cwd)
+    hash_path = output_dir_abs / f".{output_filename}.sha256"
+    spec_hash = _diagram_spec_hash()
+    if (
+        not force
+        and output_path_abs.exists()
+        and hash_path.exists()
+        and hash_path.read_text().strip() == spec_hash
+    ):
+        print(f"Pipeline diagram up to date: {output_path_abs}")
+        return
+    
+    
+    with Diagram(
+        "Bioinformatics Pipeline Architecture",
+        # Absolute path: diagrams renders there directly, no process-wide chdir needed
+        filename=str(output_dir_abs / output_filename),
+        show=False,
+        direction="LR",
+        graph_attr={
+            "bgcolor": "white",
+            "pad": "1.5",
+            "splines": "ortho",
+            "nodesep": "1.0",
+            "ranksep": "1.5",
+            "fontsize": "16",
+            "fontname": "Arial",
+            "labeljust": "l",
+        },
+        node_attr={
+            "fontsize": "11",
+            "fontname": "Arial",
+            "shape": "box",
+            "style": "rounded,filled",
+            "fillcolor": "lightblue",
+        },
+    ):
+        with Cluster("Dagster Orchestration", graph_attr={
+            "bgcolor": "lightgray",
+            "style": "rounded,filled",
+            "labeljust": "l",
+            "fontsize": "14",
+            "fontname": "Arial Bold",
+        }):
+            # Input: Nanopore pod5
+            pod5 = Storage(
+                "Nanopore\npod5",
+                **{"fillcolor": "#E8F4F8", "style": "rounded,filled"}
+            )
+            
+            # Processing tools
+            dorado = Python(
+                "Dorado\nBasecalling",
+                **{"fillcolor": "#4ECDC4", "style": "rounded,filled"}
+            )
+            modkit = Python(
+                "Modkit\nMethylation\nCalling",
+                **{"fillcolor": "#4ECDC4", "style": "rounded,filled"}
+            )
+            
+            # Storage: Apache Parquet
+            parquet = Storage(
+                "Apache\nParquet\nStorage",
+                **{"fillcolor": "#FFE66D", "style": "rounded,filled"}
+            )
+            
+            # Query engines
+            polars = SQL(
+                "Polars\nQuery Engine",
+                **{"fillcolor": "#95E1D3", "style": "rounded,filled"}
+            )
+            duckdb = Duckdb(
+                "DuckDB\nQuery Engine",
+                **{"fillcolor": "#95E1D3", "style": "rounded,filled"}
+            )
+            
+            # Flow connections - processing pipeline
+            pod5 >> Edge(
+                label="Raw reads",
+                style="bold",
+                color="#2C3E50",
+                penwidth="2.5"
+            ) >> dorado
+            
+            dorado >> Edge(
+                label="BAM files",
+                style="bold",
+                color="#27AE60",
+                penwidth="2.5"
+            ) >> modkit
+            
+            modkit >> Edge(
+                label="Methylation calls",
+                style="bold",
+                color="#E74C3C",
+                penwidth="2.5"
+            ) >> parquet
+            
+            # Query connections - parallel querying
+            parquet >> Edge(
+                label="Query",
+                style="dashed",
+                color="#7F8C8D",
+                penwidth="2.0"
+            ) >> polars
+            
+            parquet >> Edge(
+                label="Query",
+                style="dashed",
+                color="#7F8C8D",
+                penwidth="2.0"
+            ) >> duckdb
     
+    hash_path.write_text(spec_hash + "\n")
     print(f"Pipeline diagram saved to: {output_path_abs}")
 
 
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Generate the methylation pipeline, risk heatmap, and clock validation figures.
+
+Single entry point for the figures in ``rogen_aging.methylation_visualizations`` so
+that rendering several targets pays the matplotlib/seaborn import cost once.
+
+Targets:
+    methylation  Pipeline QA PNGs (workflow, DMR examples, summary, clock validation)
+    heatmap      Bimodal risk heatmap (Figure 2, Activity 2.1.7)
+    clock        Methylation clock validation scatter (Figure 3, Activity 2.1.10)
+    all          methylation + heatmap (default)
+
+Usage:
+    uv run python scripts/figures/generate_viz.py
+    uv run python scripts/figures/generate_viz.py --target heatmap --target clock
+    uv run python scripts/figures/generate_viz.py --format svg   # vector, much faster to save
+    uv run python scripts/figures/generate_viz.py --force        # ignore .<name>.sha256 sidecars
+    uv run python scripts/figures/generate_viz.py -j 0           # methylation figures on all CPUs
+"""
+
+from __future__ import annotations
+
+from enum import StrEnum
+
+import typer
+
+from rogen_aging.methylation_visualizations import (
+    create_bimodal_risk_heatmap,
+    create_clock_validation_plot,
+    generate_all_visualizations,
+)
+
+
+class VizTarget(StrEnum):
+    methylation = "methylation"
+    heatmap = "heatmap"
+    clock = "clock"
+    all = "all"
+
+
+class FigureFormat(StrEnum):
+    png = "png"
+    svg = "svg"
+    pdf = "pdf"
+
+
+def run_targets(
+    targets: list[VizTarget],
+    fmt: FigureFormat = FigureFormat.png,
+    force: bool = False,
+    workers: int | None = 1,
+) -> None:
+    """Render each requested target once (``all`` expands to methylation + heatmap).
+
+    Figures that are already current (see their ``.<name>.sha256`` sidecars) are
+    skipped unless ``force`` is set. ``workers`` parallelizes the methylation set.
+    """
+    selected = set(targets)
+    if VizTarget.all in selected:
+        selected |= {VizTarget.methylation, VizTarget.heatmap}
+    if VizTarget.methylation in selected:
+        # generate_all_visualizations already renders the clock validation plot.
+        selected.discard(VizTarget.clock)
+        generate_all_visualizations(fmt=fmt, force=force, workers=workers)
+    if VizTarget.heatmap in selected:
+        create_bimodal_risk_heatmap(fmt=fmt, force=force)
+    if VizTarget.clock in selected:
+        create_clock_validation_plot(fmt=fmt, force=force)
+
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+def main(
+    target: list[VizTarget] = typer.Option(
+        [VizTarget.all],
+        "--target",
+        "-t",
+        help="Figure set to render; repeat to select several.",
+    ),
+    fmt: FigureFormat = typer.Option(
+        FigureFormat.png,
+        "--format",
+        "-f",
+        help="Output format; svg/pdf skip PNG rasterization and encoding.",
+    ),
+    force: bool = typer.Option(
+        False, "--force", help="Re-render figures even if their sidecar hash is current."
+    ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        "-j",
+        min=0,
+        help="Processes rendering the methylation figures in parallel (0 = all CPUs).",
+    ),
+) -> None:
+    run_targets(target, fmt, force, workers or None)
+
+
+if __name__ == "__main__":
+    app()
@@ -1,18 +1,28 @@
 """Network Hub Visualizer for Protein Interaction Topology."""
 
+from __future__ import annotations
+
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import matplotlib.pyplot as plt
-import networkx as nx
+import numpy as np
+from matplotlib.lines import Line2D
 
+if TYPE_CHECKING:
+    import networkx as nx
 
-def create_network_visualization(output_path: str = "analysis/Network_Analysis_Nov.png") -> None:
-    """
-    Create and save a network visualization of protein interactions.
-    
-    Args:
-        output_path: Path where the visualization will be saved
+
+@cache
+def _network_layout() -> tuple[nx.Graph, dict[str, np.ndarray], dict[str, float]]:
+    """Build the static interaction graph with its spring layout and degree centrality.
+
+    The nodes and edges are hard-coded, so the layout is computed once per process;
+    callers must treat the returned graph and dicts as read-only.
     """
+    import networkx as nx
+
     # Genes identified in previous reports (Longevity + Neurodegeneration overlap)
     # We categorize them to color-code the nodes
     genes = {
@@ -39,26 +49,48 @@ def create_network_visualization(output_path: str = "analysis/Network_Analysis_N
 
     # Compute centrality to determine node size
     centrality = nx.degree_centrality(G)
+    pos = nx.spring_layout(G, k=0.5, seed=42)
+    return G, pos, centrality
+
+
+def create_network_visualization(
+    output_path: str = "analysis/Network_Analysis_Nov.png", show: bool = False
+) -> None:
+    """
+    Create and save a network visualization of protein interactions.
+    
+    Args:
+        output_path: Path where the visualization will be saved
+        show: Also open the figure in an interactive window (blocks until closed)
+    """
+    import networkx as nx
+
+    G, pos, centrality = _network_layout()
 
     # Plotting
-    plt.figure(figsize=(10, 8))
-    pos = nx.spring_layout(G, k=0.5, seed=42)
+    fig = plt.figure(figsize=(10, 8))
 
-    # Draw nodes by category
+    # Draw nodes by category in a single collection
     colors = {'Hubs': '#FF6B6B', 'Longevity': '#4ECDC4', 'Neuro': '#FFE66D'}
-    for cat, color in colors.items():
-        nodelist = [n for n, d in G.nodes(data=True) if d['category'] == cat]
-        nx.draw_networkx_nodes(
-            G, pos, nodelist=nodelist, node_color=color,
-            node_size=[centrality[n]*3000 + 500 for n in nodelist],
-            label=cat, alpha=0.9
-        )
+    nodes = list(G.nodes)
+    xy = np.array([pos[n] for n in nodes])
+    plt.scatter(
+        xy[:, 0], xy[:, 1],
+        c=[colors[G.nodes[n]['category']] for n in nodes],
+        s=[centrality[n]*3000 + 500 for n in nodes],
+        alpha=0.9, zorder=2
+    )
+    handles = [
+        Line2D([], [], marker='o', linestyle='', markersize=12, markerfacecolor=color,
+               markeredgecolor=color, alpha=0.9, label=cat)
+        for cat, color in colors.items()
+    ]
 
     nx.draw_networkx_edges(G, pos, width=2, alpha=0.4, edge_color='gray')
     nx.draw_networkx_labels(G, pos, font_size=10, font_weight='bold')
 
     plt.title("Protein Interaction Topology: The 'Resilience Core'")
-    plt.legend(scatterpoints=1)
+    plt.legend(handles=handles)
     plt.axis('off')
     
     # Save the figure
@@ -66,7 +98,9 @@ def create_network_visualization(output_path: str = "analysis/Network_Analysis_N
     plt.savefig(output_file, dpi=300, bbox_inches='tight')
     print(f"Network visualization saved to: {output_file.absolute()}")
     
-    plt.show()
+    if show:
+        plt.show()
+    plt.close(fig)
 
 
 if __name__ == "__main__":
@@ -2,7 +2,16 @@
 
 from __future__ import annotations
 
+import multiprocessing
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass
+from enum import StrEnum
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
@@ -11,6 +20,9 @@ import typer
 from rogen_aging.config import cfg_path, get_config
 from rogen_aging.config.cli import config_option, load_cli_config
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 DUMMY_SNP_IDS: tuple[str, ...] = (
     "rs_mock_001",
     "rs_mock_002",
@@ -20,6 +32,143 @@ DUMMY_SNP_IDS: tuple[str, ...] = (
 )
 
 
+# Rows generated (and held in memory) per chunk when streaming large cohorts.
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+
+@dataclass(frozen=True)
+class _MockParams:
+    """Resolved generation parameters shared by every chunk."""
+
+    n_samples: int
+    min_age: int
+    max_age: int
+    eaa_mean: float
+    eaa_std: float
+    maf: float
+
+    @property
+    def age_dtype(self) -> type[np.signedinteger]:
+        """Smallest signed integer type holding ``[min_age, max_age]`` (``int8`` for adults)."""
+        for dtype in (np.int8, np.int16, np.int32):
+            info = np.iinfo(dtype)
+            if info.min <= self.min_age and self.max_age <= info.max:
+                return dtype
+        return np.int64
+
+
+def _resolve_params(
+    n_samples: int | None,
+    min_age: int | None,
+    max_age: int | None,
+    eaa_mean: float,
+    eaa_std: float | None,
+    snp_maf: float | None,
+) -> _MockParams:
+    cfg = get_config().ukb
+    return _MockParams(
+        n_samples=int(cfg.mock_n_samples if n_samples is None else n_samples),
+        min_age=int(cfg.mock_age_min if min_age is None else min_age),
+        max_age=int(cfg.mock_age_max if max_age is None else max_age),
+        eaa_mean=float(eaa_mean),
+        eaa_std=float(cfg.mock_eaa_std if eaa_std is None else eaa_std),
+        maf=float(cfg.mock_maf if snp_maf is None else snp_maf),
+    )
+
+
+def _sample_ids(start: int, n: int) -> np.ndarray:
+    """``MOCK_%08d`` IDs for rows ``start + 1 .. start + n`` (wider past 10**8 - 1)."""
+    id_digits = np.arange(start + 1, start + n + 1).astype(str)
+    # np.char.zfill cannot reduce over an empty array, hence the guard.
+    return np.char.add("MOCK_", np.char.zfill(id_digits, 8)) if n else id_digits
+
+
+def _generate_chunk(
+    params: _MockParams, seed_seq: np.random.SeedSequence, start: int, n: int
+) -> pd.DataFrame:
+    """Rows ``start .. start + n - 1`` of the cohort, drawn from their own child stream."""
+    rng = np.random.default_rng(seed_seq)
+    sample_ids = _sample_ids(start, n)
+    # Narrow dtypes at creation (drawn as int64/float64, so the streams are unchanged).
+    age = rng.integers(params.min_age, params.max_age + 1, size=n).astype(params.age_dtype)
+    sex = rng.integers(0, 2, size=n)
+    bmi = rng.uniform(15.0, 50.0, size=n)
+    ad_diagnosis = rng.binomial(1, 0.02, size=n)
+    eaa = rng.normal(loc=params.eaa_mean, scale=params.eaa_std, size=n).astype(np.float32)
+
+    # Under HWE a dosage is the sum of two Bernoulli(maf) alleles, i.e. Binomial(2, maf).
+    genotypes = rng.binomial(2, params.maf, size=(len(DUMMY_SNP_IDS), n)).astype(np.int8)
+
+    snp_cols = dict(zip(DUMMY_SNP_IDS, genotypes, strict=True))
+
+    return pd.DataFrame(
+        {
+            "Sample_ID": sample_ids,
+            "Age": age,
+            "Sex": sex,
+            "BMI": bmi,
+            "AD_diagnosis": ad_diagnosis,
+            "EAA": eaa,
+            **snp_cols,
+        },
+        # Every column is a freshly drawn array owned by this chunk; adopt, don't copy.
+        copy=False,
+    )
+
+
+def _chunk_plan(
+    params: _MockParams, seed: int | None, chunk_size: int
+) -> list[tuple[np.random.SeedSequence, int, int]]:
+    """``(child_seed, start, n)`` per chunk; always at least one (possibly empty) chunk."""
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    starts = range(0, max(params.n_samples, 1), chunk_size)
+    children = np.random.SeedSequence(seed).spawn(len(starts))
+    return [
+        (child, start, min(chunk_size, params.n_samples - start))
+        for child, start in zip(children, starts, strict=True)
+    ]
+
+
+def iter_synthetic_ukb_chunks(
+    n_samples: int | None = None,
+    min_age: int | None = None,
+    max_age: int | None = None,
+    eaa_mean: float = 0.0,
+    eaa_std: float | None = None,
+    snp_maf: float | None = None,
+    seed: int | None = 42,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int | None = 1,
+) -> Iterator[pd.DataFrame]:
+    """Yield the synthetic cohort as consecutive DataFrames of at most ``chunk_size`` rows.
+
+    Each chunk draws from its own ``SeedSequence(seed).spawn`` child, so peak memory is
+    O(chunk_size) and the output for a given ``(seed, chunk_size)`` is reproducible.
+    With ``workers > 1`` (``None`` = all CPUs) chunks are drawn in worker processes,
+    at most ``workers`` ahead of the consumer; the rows do not depend on ``workers``.
+    Arguments are as for :func:`generate_synthetic_ukb_data`.
+    """
+    params = _resolve_params(n_samples, min_age, max_age, eaa_mean, eaa_std, snp_maf)
+    plan = _chunk_plan(params, seed, chunk_size)
+    n_workers = min(workers or os.cpu_count() or 1, len(plan))
+    if n_workers <= 1:
+        for seed_seq, start, n in plan:
+            yield _generate_chunk(params, seed_seq, start, n)
+        return
+
+    # "spawn" avoids fork() of a possibly multi-threaded parent (BLAS, pyarrow pools).
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=ctx) as pool:
+        pending: deque[Future[pd.DataFrame]] = deque()
+        for seed_seq, start, n in plan:
+            pending.append(pool.submit(_generate_chunk, params, seed_seq, start, n))
+            if len(pending) > n_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
 def generate_synthetic_ukb_data(
     n_samples: int | None = None,
     min_age: int | None = None,
@@ -28,6 +177,8 @@ def generate_synthetic_ukb_data(
     eaa_std: float | None = None,
     snp_maf: float | None = None,
     seed: int | None = 42,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int | None = 1,
 ) -> pd.DataFrame:
     """Generate a synthetic UK Biobank-style clinical table with mock SNP genotypes.
 
@@ -39,44 +190,107 @@ def generate_synthetic_ukb_data(
         eaa_std: Standard deviation of simulated EAA.
         snp_maf: Minor allele frequency used for Hardy–Weinberg genotype draws.
         seed: Random seed; ``None`` leaves the generator unseeded.
+        chunk_size: Rows per independently seeded chunk (see
+            :func:`iter_synthetic_ukb_chunks`); part of the reproducibility key.
+        workers: Processes drawing chunks in parallel (``None`` = all CPUs).
 
     Returns:
-        DataFrame with ``Sample_ID``, demographics, ``AD_diagnosis``, ``EAA``,
-        and columns for each ID in ``DUMMY_SNP_IDS`` (dosages 0/1/2).
+        DataFrame with ``Sample_ID``, demographics (``Age`` in the smallest integer
+        type for the age range, ``int8`` by default), ``AD_diagnosis``, float32 ``EAA``,
+        and ``int8`` columns for each ID in ``DUMMY_SNP_IDS`` (dosages 0/1/2).
     """
-    cfg = get_config().ukb
-    resolved_n = int(cfg.mock_n_samples if n_samples is None else n_samples)
-    resolved_min_age = int(cfg.mock_age_min if min_age is None else min_age)
-    resolved_max_age = int(cfg.mock_age_max if max_age is None else max_age)
-    resolved_eaa_std = float(cfg.mock_eaa_std if eaa_std is None else eaa_std)
-    resolved_maf = float(cfg.mock_maf if snp_maf is None else snp_maf)
-
-    rng = np.random.default_rng(seed)
-    sample_ids = [f"MOCK_{i:08d}" for i in range(1, resolved_n + 1)]
-    age = rng.integers(resolved_min_age, resolved_max_age + 1, size=resolved_n)
-    sex = rng.integers(0, 2, size=resolved_n)
-    bmi = rng.uniform(15.0, 50.0, size=resolved_n)
-    ad_diagnosis = rng.binomial(1, 0.02, size=resolved_n)
-    eaa = rng.normal(loc=eaa_mean, scale=resolved_eaa_std, size=resolved_n)
-
-    p_0 = (1 - resolved_maf) ** 2
-    p_1 = 2 * resolved_maf * (1 - resolved_maf)
-    p_2 = resolved_maf**2
-    probs = [p_0, p_1, p_2]
-
-    snp_cols = {snp_id: rng.choice([0, 1, 2], size=resolved_n, p=probs) for snp_id in DUMMY_SNP_IDS}
-
-    return pd.DataFrame(
-        {
-            "Sample_ID": sample_ids,
-            "Age": age,
-            "Sex": sex,
-            "BMI": bmi,
-            "AD_diagnosis": ad_diagnosis,
-            "EAA": eaa,
-            **snp_cols,
-        }
+    chunks = iter_synthetic_ukb_chunks(
+        n_samples,
+        min_age,
+        max_age,
+        eaa_mean,
+        eaa_std,
+        snp_maf,
+        seed=seed,
+        chunk_size=chunk_size,
+        workers=workers,
     )
+    return pd.concat(chunks, ignore_index=True)
+
+
+class OutputFormat(StrEnum):
+    """On-disk format for the generated table."""
+
+    AUTO = "auto"
+    CSV = "csv"
+    PARQUET = "parquet"
+
+
+def resolve_output_format(path: Path, fmt: OutputFormat | str = OutputFormat.AUTO) -> OutputFormat:
+    """Resolve ``auto`` from the output suffix (``.parquet``/``.pq`` → Parquet, else CSV)."""
+    fmt = OutputFormat(fmt)
+    if fmt is not OutputFormat.AUTO:
+        return fmt
+    return OutputFormat.PARQUET if path.suffix.lower() in {".parquet", ".pq"} else OutputFormat.CSV
+
+
+# Characters that force a CSV field to be quoted (RFC 4180).
+_CSV_STRUCTURAL_RE = r'[,"\r\n]'
+
+
+def _csv_quoting_style(table: pa.Table) -> str:
+    """``"none"`` (as ``to_csv`` writes generated IDs) unless a string field needs quotes.
+
+    With ``"none"`` Arrow raises on a later value that would need quoting rather than
+    writing an invalid file.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    for field, column in zip(table.schema, table.columns, strict=True):
+        if pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
+            if pc.any(pc.match_substring_regex(column, _CSV_STRUCTURAL_RE)).as_py():
+                return "needed"
+    return "none"
+
+
+def write_mock_clinical_chunks(
+    chunks: Iterable[pd.DataFrame],
+    path: Path,
+    fmt: OutputFormat | str = OutputFormat.AUTO,
+) -> tuple[OutputFormat, int]:
+    """Stream chunks to one CSV or zstd Parquet file; returns ``(format, rows_written)``.
+
+    Both formats are written by Arrow's multi-threaded writers from zero-copy
+    ``pa.Table`` views of each chunk. CSV matches ``DataFrame.to_csv(index=False)``:
+    unquoted header, and values quoted only if a string field needs it.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+
+    resolved = resolve_output_format(path, fmt)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    n_rows = 0
+    with ExitStack() as stack:
+        writer = None
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                if resolved is OutputFormat.PARQUET:
+                    writer = pq.ParquetWriter(path, table.schema, compression="zstd")
+                else:
+                    sink = stack.enter_context(pa.OSFile(str(path), "wb"))
+                    options = pa_csv.WriteOptions(
+                        quoting_style=_csv_quoting_style(table), quoting_header="none"
+                    )
+                    writer = pa_csv.CSVWriter(sink, table.schema, write_options=options)
+                stack.callback(writer.close)
+            writer.write_table(table)
+            n_rows += table.num_rows
+    return resolved, n_rows
+
+
+def write_mock_clinical(
+    df: pd.DataFrame, path: Path, fmt: OutputFormat | str = OutputFormat.AUTO
+) -> OutputFormat:
+    """Write the mock table as CSV or zstd-compressed Parquet; returns the format used."""
+    return write_mock_clinical_chunks([df], path, fmt)[0]
 
 
 app = typer.Typer(
@@ -97,7 +311,13 @@ def main(
         None,
         "--output",
         "-o",
-        help="Output CSV path. Default: from config.",
+        help="Output CSV/Parquet path. Default: from config.",
+    ),
+    output_format: OutputFormat = typer.Option(
+        OutputFormat.AUTO,
+        "--format",
+        "-f",
+        help="Output format; 'auto' picks Parquet for .parquet/.pq paths, CSV otherwise.",
     ),
     seed: int | None = typer.Option(
         42,
@@ -105,6 +325,19 @@ def main(
         "-s",
         help="Random seed for reproducibility. Use 0 for no seed.",
     ),
+    chunk_size: int = typer.Option(
+        DEFAULT_CHUNK_SIZE,
+        "--chunk-size",
+        min=1,
+        help="Rows generated and written per chunk (caps peak memory).",
+    ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        "-j",
+        min=0,
+        help="Processes generating chunks in parallel (0 = all CPUs).",
+    ),
 ) -> None:
     """Generate synthetic UK Biobank-style mock clinical data."""
     load_cli_config(config)
@@ -112,7 +345,8 @@ def main(
     resolved_n = int(cfg.ukb.mock_n_samples if n_samples is None else n_samples)
     resolved_output = output or cfg_path(cfg, "paths", "ukb", "mock_clinical")
     resolved_seed = None if seed == 0 else seed
-    df = generate_synthetic_ukb_data(n_samples=resolved_n, seed=resolved_seed)
-    resolved_output.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(resolved_output, index=False)
-    typer.echo(f"Wrote {len(df)} synthetic samples to {resolved_output}")
+    chunks = iter_synthetic_ukb_chunks(
+        n_samples=resolved_n, seed=resolved_seed, chunk_size=chunk_size, workers=workers or None
+    )
+    written_format, n_rows = write_mock_clinical_chunks(chunks, resolved_output, output_format)
+    typer.echo(f"Wrote {n_rows} synthetic samples to {resolved_output} ({written_format})")
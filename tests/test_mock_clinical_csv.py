@@ -2,10 +2,19 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import polars as pl
 import pytest
 
-from rogen_aging.ukb.mock_clinical import DUMMY_SNP_IDS, generate_synthetic_ukb_data
+from rogen_aging.ukb.mock_clinical import (
+    DUMMY_SNP_IDS,
+    OutputFormat,
+    generate_synthetic_ukb_data,
+    iter_synthetic_ukb_chunks,
+    write_mock_clinical,
+    write_mock_clinical_chunks,
+)
 
 REQUIRED_CLINICAL_COLUMNS: tuple[str, ...] = (
     "Sample_ID",
@@ -58,5 +67,63 @@ def test_mock_clinical_plausible_ranges(synthetic_clinical_frame: pl.DataFrame)
         assert g.max() <= 2
         assert g.dtype.is_integer()
 
+    assert age.dtype == pl.Int8
+    assert synthetic_clinical_frame["EAA"].dtype == pl.Float32
+
     assert synthetic_clinical_frame["Sample_ID"].str.starts_with("MOCK_").all()
     assert synthetic_clinical_frame.height == 32
+
+
+def test_mock_clinical_parquet_roundtrip(tmp_path: Path) -> None:
+    df = generate_synthetic_ukb_data(n_samples=32, seed=7)
+    out = tmp_path / "cohort.parquet"
+    assert write_mock_clinical(df, out) is OutputFormat.PARQUET
+
+    back = pl.read_parquet(out)
+    assert back.height == 32
+    assert back["Age"].dtype == pl.Int8
+    assert back["EAA"].dtype == pl.Float32
+    for snp in DUMMY_SNP_IDS:
+        assert back[snp].dtype == pl.Int8
+    assert back["Sample_ID"].to_list() == df["Sample_ID"].tolist()
+
+    assert write_mock_clinical(df, tmp_path / "cohort.csv") is OutputFormat.CSV
+
+
+def test_mock_clinical_streamed_chunks_match_in_memory(tmp_path: Path) -> None:
+    df = generate_synthetic_ukb_data(n_samples=25, seed=7, chunk_size=10)
+    out = tmp_path / "cohort.csv"
+    chunks = iter_synthetic_ukb_chunks(n_samples=25, seed=7, chunk_size=10)
+    assert write_mock_clinical_chunks(chunks, out) == (OutputFormat.CSV, 25)
+
+    back = pl.read_csv(out)
+    assert back["Sample_ID"].to_list() == [f"MOCK_{i:08d}" for i in range(1, 26)]
+    assert back["Age"].to_list() == df["Age"].tolist()
+    for snp in DUMMY_SNP_IDS:
+        assert back[snp].to_list() == df[snp].tolist()
+
+
+def test_mock_clinical_parallel_workers_match_serial() -> None:
+    serial = generate_synthetic_ukb_data(n_samples=25, seed=7, chunk_size=10)
+    parallel = generate_synthetic_ukb_data(n_samples=25, seed=7, chunk_size=10, workers=2)
+    assert parallel.equals(serial)
+
+
+def test_mock_clinical_csv_quotes_fields_with_separators(tmp_path: Path) -> None:
+    df = generate_synthetic_ukb_data(n_samples=3, seed=7)
+    df["Sample_ID"] = ["MOCK,1", 'MOCK"2', "MOCK_3"]
+    out = tmp_path / "cohort.csv"
+    write_mock_clinical(df, out)
+
+    back = pl.read_csv(out)
+    assert back.columns == list(df.columns)
+    assert back["Sample_ID"].to_list() == ["MOCK,1", 'MOCK"2', "MOCK_3"]
+
+
+def test_mock_clinical_csv_matches_to_csv(tmp_path: Path) -> None:
+    df = generate_synthetic_ukb_data(n_samples=200, seed=7)
+    out = tmp_path / "cohort.csv"
+    write_mock_clinical(df, out)
+
+    expected = df.to_csv(index=False, lineterminator="\n").encode()
+    assert out.read_bytes()[:4096] == expected[:4096]